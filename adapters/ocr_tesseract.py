@@ -3,48 +3,362 @@ Adaptador de Tesseract OCR.
 
 Implementación con imports perezosos para minimizar dependencias en tiempo de import.
 Usa pdf2image para rasterizar el PDF y pytesseract para extraer texto.
+
+Las páginas se agrupan en lotes (archivo de lista de imágenes) para que
+Tesseract cargue el traineddata una sola vez por lote, y los lotes se
+reparten en un ProcessPoolExecutor: Tesseract es CPU-bound dentro de
+código nativo, por lo que un proceso por núcleo da un speedup casi
+lineal en PDFs multipágina.
 """
+import hashlib
+import os
+import queue
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import List, Optional, Sequence
+
 from application.ports import OCRPort
+from utils.file_utils import fast_page_count
+
+
+def _cache_key(pdf_path: Path, config: str) -> str:
+    """
+    Clave de caché: digest blake2b del contenido del PDF más la
+    configuración del adaptador.
+
+    blake2b corre a ~1 GB/s frente a ~1 MB/s de Tesseract, así que el
+    coste del hash es despreciable frente a un OCR completo.
+    """
+    digest = hashlib.blake2b(pdf_path.read_bytes(), digest_size=16).hexdigest()
+    return f"{digest}-{config}"
+
+
+def _cache_lookup(cache_dir: Path, key: str) -> Optional[str]:
+    """Retorna el texto cacheado para ``key`` o ``None`` si no hay hit."""
+    try:
+        return (cache_dir / f"{key}.txt").read_text(encoding="utf-8")
+    except Exception:
+        return None
+
+
+def _cache_store(cache_dir: Path, key: str, text: str) -> None:
+    """Escribe el resultado de forma atómica (tmp + rename) en la caché."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_dir / f".{key}.tmp"
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, cache_dir / f"{key}.txt")
+    except Exception:
+        # La caché es oportunista: un fallo al escribir no detiene el flujo
+        pass
+
+
+def _init_worker() -> None:
+    """
+    Inicializa cada proceso worker del pool.
+
+    Limita el OpenMP interno de Tesseract (y las librerías numéricas) a un
+    hilo para evitar sobresuscripción N² cuando ya hay un proceso por núcleo.
+    """
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+    try:
+        import cv2  # type: ignore
+
+        cv2.setNumThreads(1)
+        cv2.ocl.setUseOpenCL(False)
+    except Exception:
+        pass
+
+
+# API tesserocr reutilizable por proceso: el coste de inicializar el motor
+# (parseo de traineddata) se amortiza a O(1) por worker.
+_TESS_API = None
+_TESS_API_LANG = None
+
+
+def _get_tesserocr_api(lang: str):
+    """
+    Retorna una instancia ``PyTessBaseAPI`` en proceso, creada una sola vez
+    por worker y reutilizada entre páginas.
+
+    Retorna ``None`` si tesserocr no está instalado; los llamadores caen
+    entonces al camino de pytesseract (subproceso).
+    """
+    global _TESS_API, _TESS_API_LANG
+    if _TESS_API is not None and _TESS_API_LANG == lang:
+        return _TESS_API
+    try:
+        import tesserocr  # type: ignore
+    except Exception:
+        return None
+    try:
+        if _TESS_API is not None:
+            _TESS_API.End()
+        _TESS_API = tesserocr.PyTessBaseAPI(lang=lang, psm=tesserocr.PSM.AUTO)
+        _TESS_API_LANG = lang
+        return _TESS_API
+    except Exception:
+        _TESS_API = None
+        return None
+
+
+def _is_blank_page(path: str) -> bool:
+    """
+    Detecta páginas en blanco (o casi) sin pasar por Tesseract.
+
+    Una desviación estándar < 3 sobre el canal de luminancia indica una
+    página esencialmente uniforme; el cálculo cuesta una fracción de ms
+    frente a los segundos que tardaría el OCR.
+    """
+    try:
+        from PIL import Image, ImageStat  # type: ignore
+
+        with Image.open(path) as img:
+            return ImageStat.Stat(img.convert("L")).stddev[0] < 3.0
+    except Exception:
+        return False
+
+
+def _ocr_batch(page_paths: Sequence[str], lang: str) -> List[str]:
+    """
+    Ejecuta OCR sobre un lote de páginas en una sola invocación de Tesseract.
+
+    Escribe un ``list.txt`` con las rutas de las páginas y lo pasa a
+    ``pytesseract``; Tesseract procesa todo el lote en un único ciclo de
+    vida del motor, evitando (N-1) inicializaciones de traineddata. La
+    salida se divide por el separador de página form-feed (``\\f``).
+
+    Definida a nivel de módulo para que sea picklable por el pool.
+    Retorna cadenas vacías si el OCR del lote falla.
+    """
+    # Filtrar páginas en blanco antes de tocar el motor OCR
+    blanks = [_is_blank_page(p) for p in page_paths]
+    if all(blanks):
+        return ["" for _ in page_paths]
+    if any(blanks):
+        pending = [p for p, blank in zip(page_paths, blanks) if not blank]
+        parciales = iter(_ocr_batch(pending, lang))
+        return ["" if blank else next(parciales) for blank in blanks]
+
+    # Camino rápido: API en proceso de tesserocr, sin fork/exec por lote
+    api = _get_tesserocr_api(lang)
+    if api is not None:
+        try:
+            from PIL import Image  # type: ignore
+
+            textos = []
+            for path in page_paths:
+                with Image.open(path) as img:
+                    api.SetImage(img)
+                    textos.append(api.GetUTF8Text())
+            return textos
+        except Exception:
+            pass
+
+    try:
+        import pytesseract  # type: ignore
+    except Exception:
+        return ["" for _ in page_paths]
+
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".txt", delete=False, encoding="utf-8"
+        ) as handle:
+            handle.write("\n".join(page_paths))
+            list_path = handle.name
+        try:
+            raw = pytesseract.image_to_string(list_path, lang=lang)
+        finally:
+            os.unlink(list_path)
+        pages = raw.split("\f")
+        # Tesseract puede emitir un form-feed final; normalizar al número de páginas
+        pages.extend("" for _ in range(len(page_paths) - len(pages)))
+        return pages[: len(page_paths)]
+    except Exception:
+        # Si el lote falla, reintentar página a página para no perder todo
+        textos = []
+        for path in page_paths:
+            try:
+                textos.append(pytesseract.image_to_string(path, lang=lang))
+            except Exception:
+                textos.append("")
+        return textos
 
 
 class TesseractAdapter(OCRPort):
     """Adaptador Tesseract con configuración simple de idioma y DPI."""
 
-    def __init__(self, lang: str = "spa", dpi: int = 300) -> None:
+    def __init__(
+        self, lang: str = "spa", dpi: int = 300, cache_dir: Optional[Path] = None
+    ) -> None:
         self.lang = lang
         self.dpi = dpi
+        # Caché en disco de resultados por hash de contenido; None la desactiva
+        self.cache_dir = cache_dir
 
     def extract_text(self, pdf_path: Path) -> str:
         """
         Extrae texto de un PDF página por página y lo concatena.
 
         Usa imports perezosos para no requerir dependencias durante testing
-        cuando se usan mocks.
+        cuando se usan mocks. La rasterización y el OCR se solapan con un
+        esquema productor/consumidor: un hilo rasteriza trozos de páginas
+        (``first_page``/``last_page``) hacia una cola acotada mientras los
+        procesos worker OCRean los trozos ya disponibles; cada trozo es una
+        única invocación de Tesseract. Los resultados se recogen de los
+        futuros en orden de envío, preservando el orden de páginas.
         """
         if not pdf_path.exists():
             raise FileNotFoundError(f"Archivo no encontrado: {pdf_path}")
 
+        # Caché por hash de contenido: un re-proceso del mismo PDF con la
+        # misma configuración se resuelve sin rasterizar ni OCRear
+        cache_key = None
+        if self.cache_dir is not None:
+            try:
+                cache_key = _cache_key(pdf_path, f"{self.lang}-{self.dpi}")
+                cached = _cache_lookup(self.cache_dir, cache_key)
+                if cached is not None:
+                    return cached
+            except Exception:
+                cache_key = None
+
         # Imports perezosos
         try:
-            from pdf2image import convert_from_path  # type: ignore
-            import pytesseract  # type: ignore
+            from pdf2image import convert_from_path, pdfinfo_from_path  # type: ignore
         except Exception:
             # Si no están disponibles, retornar texto vacío en lugar de fallar
             return ""
 
-        try:
-            images = convert_from_path(str(pdf_path), dpi=self.dpi)
-        except Exception:
-            # Si la rasterización falla, retornar vacío para no detener el flujo
-            return ""
+        # Evitar que el OpenMP de Tesseract compita con el pool de procesos
+        os.environ.setdefault("OMP_THREAD_LIMIT", "1")
 
-        textos = []
-        for img in images:
-            try:
-                texto = pytesseract.image_to_string(img, lang=self.lang)
-            except Exception:
-                texto = ""
-            textos.append(texto.strip())
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # paths_only evita materializar las páginas como objetos PIL en
+            # RAM (~25 MB por página A4 a 300 DPI): poppler escribe los JPEG
+            # al directorio temporal y solo circulan rutas. Por encima de
+            # ~300 DPI Tesseract no gana precisión y el coste crece
+            # cuadráticamente con los píxeles: limitar la rasterización
+            # evita generar (y OCRear) píxeles inútiles
+            render = partial(
+                convert_from_path,
+                str(pdf_path),
+                dpi=min(self.dpi, 300),
+                output_folder=tmp_dir,
+                fmt="jpeg",
+                paths_only=True,
+            )
+
+            # Contar páginas sin parsear el PDF: primero el escaneo del
+            # trailer (unos KB leídos, sin subprocesos) y solo si falla se
+            # recurre a pdfinfo, que lanza un proceso de poppler
+            n_pages = fast_page_count(pdf_path)
+            if n_pages <= 0:
+                try:
+                    n_pages = int(pdfinfo_from_path(str(pdf_path))["Pages"])
+                except Exception:
+                    n_pages = 0
+
+            # Dentro de un worker del lote ("Procesar todos") el
+            # paralelismo ya viene dado a nivel de documento: anidar aquí
+            # otro pool multiplicaría los procesos de OCR; la ruta serie
+            # de abajo hace el trabajo de este documento en su worker
+            if os.environ.get("OCR_CLI_POOL_WORKER"):
+                max_workers = 1
+            else:
+                max_workers = max(1, (os.cpu_count() or 1) - 1)
+            if max_workers == 1 or n_pages <= 1:
+                # Una sola página o un solo núcleo: rasterizar todo de una
+                # vez y procesar un único lote en este mismo proceso
+                try:
+                    page_paths: List[str] = render(
+                        thread_count=os.cpu_count() or 1
+                    )
+                except Exception:
+                    # Si la rasterización falla, retornar vacío para no
+                    # detener el flujo
+                    return ""
+                if not page_paths:
+                    return ""
+                textos = _ocr_batch(page_paths, self.lang)
+            else:
+                # Productor/consumidor: poppler y Tesseract son programas
+                # nativos independientes, así que mientras los workers
+                # OCRean el trozo K un hilo productor rasteriza el K+1 y
+                # las dos etapas se solapan en lugar de serializarse. La
+                # cola acotada impide que la rasterización se adelante más
+                # de dos trozos y acumule páginas sin consumir en disco.
+                # n_pages es solo una estimación para dimensionar los
+                # trozos (el escaneo del trailer puede quedarse corto en
+                # árboles de páginas divididos): el productor rasteriza
+                # hasta que poppler devuelve un trozo vacío, así que
+                # ninguna página se pierde aunque la cuenta subestime
+                chunk_size = max(1, n_pages // (max_workers * 2))
+                pendientes: "queue.Queue" = queue.Queue(maxsize=2)
+
+                def _producir() -> None:
+                    try:
+                        first = 1
+                        while True:
+                            lote = render(
+                                first_page=first,
+                                last_page=first + chunk_size - 1,
+                                thread_count=2,
+                            )
+                            if not lote:
+                                break
+                            pendientes.put(lote)
+                            first += chunk_size
+                    except Exception:
+                        pass
+                    finally:
+                        # Centinela: no habrá más trozos
+                        pendientes.put(None)
+
+                try:
+                    with ProcessPoolExecutor(
+                        max_workers=max_workers, initializer=_init_worker
+                    ) as executor:
+                        productor = threading.Thread(
+                            target=_producir, daemon=True
+                        )
+                        productor.start()
+                        futuros = []
+                        while True:
+                            lote = pendientes.get()
+                            if lote is None:
+                                break
+                            if lote:
+                                futuros.append(
+                                    executor.submit(
+                                        _ocr_batch, lote, self.lang
+                                    )
+                                )
+                        textos = [
+                            texto
+                            for futuro in futuros
+                            for texto in futuro.result()
+                        ]
+                        productor.join()
+                except Exception:
+                    # Si el pool falla (p. ej. entorno sin fork), rasterizar
+                    # completo y procesar en serie
+                    try:
+                        page_paths = render(thread_count=os.cpu_count() or 1)
+                    except Exception:
+                        return ""
+                    textos = _ocr_batch(page_paths, self.lang)
+
+        resultado = "\n\n".join(filter(None, (t.strip() for t in textos)))
+
+        # No cachear resultados vacíos: suelen deberse a fallos transitorios
+        # (dependencia ausente, pool caído) y persistirlos fijaría el vacío
+        # para ese PDF hasta borrar el archivo de caché a mano
+        if cache_key is not None and resultado:
+            _cache_store(self.cache_dir, cache_key, resultado)
 
-        return "\n\n".join(filter(None, textos))
+        return resultado
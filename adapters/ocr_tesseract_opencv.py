@@ -5,17 +5,309 @@ Implementación con imports perezosos y fallbacks seguros para ejecución en ent
 sin dependencias completas (tests). Cuando las librerías están disponibles, aplica
 un pipeline mínimo de mejora.
 """
+import os
 from pathlib import Path
 from application.ports import OCRPort
 
 
+def _estimate_skew_fast(gray):
+    """
+    Estima el ángulo de inclinación sobre una miniatura de lado largo 800 px.
+
+    Barre ángulos en [-5°, +5°] con paso 0.25° y puntúa cada candidato con
+    la varianza del perfil de proyección por filas (``cv2.reduce``): las
+    líneas de texto alineadas concentran la tinta en pocas filas y maximizan
+    la varianza. Al trabajar sobre la miniatura el coste es independiente
+    del DPI de entrada y todo el bucle vectoriza dentro de OpenCV.
+
+    Retorna el ángulo estimado en grados (0.0 si no se puede estimar).
+    """
+    try:
+        import cv2  # type: ignore
+        import numpy as np  # type: ignore
+
+        h, w = gray.shape[:2]
+        scale = 800.0 / max(h, w)
+        if scale < 1.0:
+            small = cv2.resize(
+                gray, (0, 0), fx=scale, fy=scale, interpolation=cv2.INTER_AREA
+            )
+        else:
+            small = gray
+        # Invertir para que la tinta sume: el perfil mide píxeles de texto
+        inv = cv2.threshold(
+            small, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU
+        )[1]
+        center = (inv.shape[1] // 2, inv.shape[0] // 2)
+        size = (inv.shape[1], inv.shape[0])
+
+        def _score(angle):
+            M = cv2.getRotationMatrix2D(center, float(angle), 1.0)
+            rot = cv2.warpAffine(inv, M, size)
+            perfil = cv2.reduce(rot, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S)
+            # Varianza de las diferencias del perfil: premia transiciones
+            # abruptas línea/interlínea, más discriminante que la varianza
+            # simple cuando la página tiene bloques de densidad desigual
+            d = np.diff(perfil.ravel()).astype(np.int64)
+            # np.dot reduce d·d en una sola pasada BLAS, sin materializar
+            # el cuadrado intermedio que costaría (d * d).sum()
+            return float(np.dot(d, d))
+
+        # Búsqueda gruesa-fina: 11 candidatos a paso 1° y 4 refinamientos a
+        # 0.25° alrededor del mejor — 15 rotaciones en lugar de las 41 del
+        # barrido uniforme, con la misma resolución final
+        best_angle = 0.0
+        best_score = -1.0
+        # range() en lugar de np.arange: 11 candidatos no ameritan un
+        # array ni el desempaquetado de escalares float64 de NumPy
+        for angle in range(-5, 6):
+            score = _score(angle)
+            if score > best_score:
+                best_score = score
+                best_angle = float(angle)
+        for angle in (best_angle - 0.5, best_angle - 0.25,
+                      best_angle + 0.25, best_angle + 0.5):
+            score = _score(angle)
+            if score > best_score:
+                best_score = score
+                best_angle = float(angle)
+        return best_angle
+    except Exception:
+        return 0.0
+
+
+def _order_points(pts):
+    """
+    Ordena 4 esquinas como (sup-izq, sup-der, inf-der, inf-izq).
+
+    Trabaja con escalares Python: para N=4 el despacho de NumPy
+    (sum/diff/argmin/argmax, cuatro arrays temporales) cuesta más que el
+    cálculo entero, y esta función corre una vez por página.
+    """
+    import numpy as np  # type: ignore
+
+    puntos = [(float(x), float(y)) for x, y in pts]
+    sumas = [x + y for x, y in puntos]
+    difs = [y - x for x, y in puntos]
+    tl = puntos[min(range(4), key=sumas.__getitem__)]
+    br = puntos[max(range(4), key=sumas.__getitem__)]
+    tr = puntos[min(range(4), key=difs.__getitem__)]
+    bl = puntos[max(range(4), key=difs.__getitem__)]
+    return np.array([tl, tr, br, bl], dtype="float32")
+
+
+def _four_point_transform(image, pts):
+    """Aplica la homografía que rectifica el cuadrilátero ``pts``."""
+    import cv2  # type: ignore
+    import numpy as np  # type: ignore
+
+    rect = _order_points(pts)
+    (tl, tr, br, bl) = rect
+    ancho = int(max(np.linalg.norm(br - bl), np.linalg.norm(tr - tl)))
+    alto = int(max(np.linalg.norm(tr - br), np.linalg.norm(tl - bl)))
+    destino = np.array(
+        [[0, 0], [ancho - 1, 0], [ancho - 1, alto - 1], [0, alto - 1]],
+        dtype="float32",
+    )
+    M = cv2.getPerspectiveTransform(rect, destino)
+    return cv2.warpPerspective(image, M, (ancho, alto))
+
+
+def _auto_perspective_correction(gray):
+    """
+    Rectifica la perspectiva de un documento fotografiado.
+
+    La detección corre sobre una miniatura (~1000 px de lado largo):
+    Canny y el análisis de contornos escalan con los píxeles, pero las
+    cuatro esquinas son geometría gruesa; las coordenadas detectadas se
+    reescalan y el warp final se aplica a resolución completa. Si no se
+    encuentra un cuadrilátero dominante se retorna la imagen intacta.
+    """
+    try:
+        import cv2  # type: ignore
+        import numpy as np  # type: ignore
+
+        h, w = gray.shape[:2]
+        scale = 1000.0 / max(h, w)
+        if scale < 1.0:
+            small = cv2.resize(
+                gray, (0, 0), fx=scale, fy=scale, interpolation=cv2.INTER_AREA
+            )
+        else:
+            scale = 1.0
+            small = gray
+        bordes = cv2.Canny(small, 50, 150)
+        contornos, _ = cv2.findContours(
+            bordes, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+        )
+        if not contornos:
+            return gray
+        mayor = max(contornos, key=cv2.contourArea)
+        # El documento debe dominar el encuadre; si no, mejor no tocar
+        if cv2.contourArea(mayor) < 0.2 * small.shape[0] * small.shape[1]:
+            return gray
+        perimetro = cv2.arcLength(mayor, True)
+        approx = cv2.approxPolyDP(mayor, 0.02 * perimetro, True)
+        if len(approx) != 4:
+            # Caso común (esquina tapada, borde irregular): antes era un
+            # no-op. El rectángulo de área mínima del contorno da un
+            # cuadrilátero usable con el que la corrección sigue valiendo
+            caja = cv2.boxPoints(cv2.minAreaRect(mayor))
+            esquinas = caja.astype("float32") / scale
+            return _four_point_transform(gray, esquinas)
+        esquinas = approx.reshape(4, 2).astype("float32") / scale
+        # Atajo afín: si el cuadrilátero es casi un rectángulo (cada lado
+        # prácticamente paralelo a un eje) no hay distorsión de
+        # perspectiva real, solo una rotación leve — warpAffine la
+        # resuelve con menos FMAs por píxel que el warp proyectivo 3×3.
+        # El test es aritmética escalar sobre 4 puntos: gratis frente al
+        # warp que evita
+        ordenadas = _order_points(esquinas)
+        casi_recto = True
+        for i in range(4):
+            x0, y0 = ordenadas[i]
+            x1, y1 = ordenadas[(i + 1) % 4]
+            dx = abs(float(x1) - float(x0))
+            dy = abs(float(y1) - float(y0))
+            norma = (dx * dx + dy * dy) ** 0.5
+            if norma == 0.0 or max(dx, dy) / norma <= 0.98:
+                casi_recto = False
+                break
+        if casi_recto:
+            rect = cv2.minAreaRect(esquinas)
+            angulo = rect[2]
+            if angulo > 45.0:
+                angulo -= 90.0
+            if abs(angulo) < 0.1:
+                return gray
+            centro = (gray.shape[1] // 2, gray.shape[0] // 2)
+            M = cv2.getRotationMatrix2D(centro, angulo, 1.0)
+            return cv2.warpAffine(
+                gray, M, (gray.shape[1], gray.shape[0]),
+                borderMode=cv2.BORDER_REPLICATE,
+            )
+        return _four_point_transform(gray, esquinas)
+    except Exception:
+        return gray
+
+
+def _assess_image_quality(gray):
+    """
+    Calcula métricas de calidad de una página en escala de grises.
+
+    Todas las métricas comparten la misma pasada de planificación:
+    brillo y contraste salen de un único ``cv2.meanStdDev``; el ruido se
+    estima como la media de ``cv2.absdiff`` contra un medianBlur 5×5
+    (todo en uint8, sin las copias float64 que costaría ``astype``); la
+    nitidez es la varianza del Laplaciano acumulado en CV_16S — el
+    Laplaciano de un uint8 cabe en int16, y la imagen intermedia pesa
+    2 bytes/píxel en lugar de los 8 de CV_64F en un kernel limitado por
+    memoria; la varianza sale de la desviación de ``meanStdDev``.
+    Ejecutarlas seguidas mantiene la imagen caliente en caché entre
+    métricas.
+
+    Retorna un dict con brightness, contrast, noise y sharpness (floats),
+    o un dict vacío si OpenCV no está disponible.
+    """
+    try:
+        import cv2  # type: ignore
+
+        media, std = cv2.meanStdDev(gray)
+        mediana = cv2.medianBlur(gray, 5)
+        ruido = float(cv2.absdiff(gray, mediana).mean())
+        lap = cv2.Laplacian(gray, cv2.CV_16S, ksize=3)
+        _, lap_std = cv2.meanStdDev(lap)
+        return {
+            "brightness": float(media[0][0]),
+            "contrast": float(std[0][0]),
+            "noise": ruido,
+            "sharpness": float(lap_std[0][0]) ** 2,
+        }
+    except Exception:
+        return {}
+
+
+_fused_kernel = None
+_fused_resolved = False
+
+
+def _get_fused_kernel():
+    """
+    Retorna el kernel Numba fusionado si está disponible, o ``None``.
+
+    La resolución se hace una sola vez y, si el kernel existe, se
+    precalienta con un array diminuto: la primera llamada real paga solo
+    el trabajo de la página, no la compilación JIT (con ``cache=True`` el
+    precalentamiento suele reducirse a cargar el objeto ya compilado).
+    """
+    global _fused_kernel, _fused_resolved
+    if not _fused_resolved:
+        _fused_resolved = True
+        try:
+            import numpy as np  # type: ignore
+            from adapters._preproc_numba import fused_threshold_open  # type: ignore
+
+            if fused_threshold_open is not None:
+                fused_threshold_open(np.zeros((8, 8), dtype=np.uint8))
+            _fused_kernel = fused_threshold_open
+        except Exception:
+            _fused_kernel = None
+    return _fused_kernel
+
+
 class TesseractOpenCVAdapter(OCRPort):
     """Adaptador OpenCV con flags de preprocesamiento."""
 
-    def __init__(self, *, enable_deskewing: bool, enable_denoising: bool, enable_contrast_enhancement: bool) -> None:
+    def __init__(
+        self,
+        *,
+        enable_deskewing: bool,
+        enable_denoising: bool,
+        enable_contrast_enhancement: bool,
+        uneven_lighting: bool = False,
+        input_is_scan: bool = False,
+        enable_perspective_correction: bool = False,
+    ) -> None:
         self.enable_deskewing = enable_deskewing
         self.enable_denoising = enable_denoising
         self.enable_contrast_enhancement = enable_contrast_enhancement
+        # Rectificación de perspectiva para documentos fotografiados
+        # (páginas que no son un escaneo plano); desactivada por defecto
+        # porque en PDFs rasterizados es una pasada inútil
+        self.enable_perspective_correction = enable_perspective_correction
+        # Umbral adaptativo solo para iluminación desigual (escaneos con
+        # sombras); tras CLAHE el histograma suele ser bimodal y Otsu basta
+        self.uneven_lighting = uneven_lighting
+        # Las páginas renderizadas por pdf2image no tienen ruido de sensor:
+        # el denoising solo tiene sentido sobre escaneos reales
+        self.input_is_scan = input_is_scan
+        # Objeto CLAHE de configuración pura: se crea perezosamente una vez
+        # (cv2 se importa dentro de extract_text) y se reutiliza entre páginas
+        self._clahe = None
+        self._pp_info = None
+
+    def get_preprocessing_info(self) -> dict:
+        """
+        Retorna un resumen de la configuración de preprocesamiento.
+
+        El diccionario se construye una sola vez y se cachea en la
+        instancia: los flags son argumentos del constructor y no cambian,
+        y la versión de OpenCV (si está instalado) solo se introspecciona
+        en el primer acceso.
+        """
+        if self._pp_info is None:
+            try:
+                import cv2  # type: ignore
+                opencv_version = cv2.__version__
+            except Exception:
+                opencv_version = None
+            self._pp_info = {
+                "enable_deskewing": self.enable_deskewing,
+                "enable_denoising": self.enable_denoising,
+                "enable_contrast_enhancement": self.enable_contrast_enhancement,
+                "opencv_version": opencv_version,
+            }
+        return self._pp_info
 
     def extract_text(self, pdf_path: Path) -> str:
         if not pdf_path.exists():
@@ -27,42 +319,146 @@ class TesseractOpenCVAdapter(OCRPort):
             import pytesseract  # type: ignore
             import cv2  # type: ignore
             import numpy as np  # type: ignore
+            from PIL import Image  # type: ignore
         except Exception:
             return ""
+
+        # En modo monoproceso OpenCV puede usar todos los núcleos; dentro
+        # de un pool de procesos (flag que fija el initializer del pool)
+        # se limita a 1 para no sobresuscribir: el paralelismo ya viene
+        # dado a nivel de documento
+        try:
+            if os.environ.get("OCR_CLI_POOL_WORKER"):
+                cv2.setNumThreads(1)
+            else:
+                cv2.setNumThreads(os.cpu_count() or 1)
+        except Exception:
+            pass
         
         try:
-            images = convert_from_path(str(pdf_path), dpi=300)
+            # thread_count paraleliza poppler; se mantiene PNG porque los
+            # artefactos JPEG degradan la binarización posterior
+            # grayscale=True evita dos conversiones de color completas por
+            # página (RGB→BGR→GRAY): poppler ya entrega un canal
+            images = convert_from_path(
+                str(pdf_path),
+                dpi=300,
+                thread_count=os.cpu_count() or 1,
+                fmt="png",
+                grayscale=True,
+            )
         except Exception:
             return ""
         
         textos = []
+        buf = None  # buffer de trabajo reutilizado entre etapas y páginas
         for pil_img in images:
             try:
-                img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2GRAY)
-                # Denoising
-                if self.enable_denoising:
-                    img = cv2.medianBlur(img, 3)
+                # np.asarray comparte el buffer de PIL (cero copias); la
+                # imagen ya viene en escala de grises desde poppler
+                img = np.asarray(pil_img)
+                if img.ndim == 3:
+                    # Fallback por si el backend ignora grayscale=True
+                    img = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
+                # Tesseract no gana precisión por encima de ~300 DPI
+                # efectivos pero su coste crece con los píxeles: limitar el
+                # lado largo a ~3300 px (A4 a 300 DPI)
+                h, w = img.shape[:2]
+                scale = 3300 / max(h, w)
+                if scale < 1.0:
+                    img = cv2.resize(
+                        img,
+                        (int(w * scale), int(h * scale)),
+                        interpolation=cv2.INTER_AREA,
+                    )
+                # Perspectiva: antes que cualquier filtro, para que el
+                # resto del pipeline trabaje sobre la página rectificada
+                if self.enable_perspective_correction:
+                    img = _auto_perspective_correction(img)
+                # El array compartido con PIL es de solo lectura, lo que
+                # basta para las etapas de lectura pero no para el pipeline
+                # con dst: tras el primer swap img/buf el buffer de PIL
+                # pasaría a ser destino, cv2 rechazaría escribir en él y el
+                # buf envenenado arruinaría también las páginas siguientes.
+                # Si ninguna etapa previa (resize/perspectiva) creó ya una
+                # copia, poseer los datos aquí cuesta una sola pasada
+                if not img.flags.writeable:
+                    img = img.copy()
+                # Reutilizar un único buffer destino evita una asignación
+                # H×W por etapa: el pipeline queda limitado por una sola
+                # pasada de escritura en lugar de ~3× el tráfico mínimo
+                if buf is None or buf.shape != img.shape:
+                    buf = np.empty_like(img)
+                # Páginas en blanco: meanStdDev (SIMD) cuesta una fracción
+                # de ms frente a los segundos de un OCR inútil
+                _, std = cv2.meanStdDev(img)
+                if float(std[0][0]) < 3.0:
+                    textos.append("")
+                    continue
+                # Denoising: solo para escaneos reales; una página
+                # rasterizada no tiene ruido que eliminar
+                if self.enable_denoising and self.input_is_scan:
+                    # Estimación barata del nivel de ruido (media del
+                    # residuo contra un medianBlur): NLMeans recorre 441
+                    # parches de referencia por píxel y solo compensa en
+                    # páginas realmente ruidosas. El medianBlur se escribe
+                    # directo en el buffer de trabajo: si el ruido es bajo,
+                    # esa misma imagen ya ES el denoise (el filtro de
+                    # mediana elimina sal-y-pimienta y respeta bordes), así
+                    # que la rama tranquila no paga ninguna pasada extra
+                    cv2.medianBlur(img, 5, dst=buf)
+                    ruido = float(cv2.absdiff(img, buf).mean())
+                    if ruido > 10.0:
+                        # fastNlMeansDenoising (paralelo vía OpenMP en
+                        # OpenCV) para escaneos con ruido de sensor fuerte;
+                        # sobrescribe la mediana, que ya no se necesita
+                        cv2.fastNlMeansDenoising(
+                            img, dst=buf, h=10, templateWindowSize=7, searchWindowSize=21
+                        )
+                    img, buf = buf, img
                 # Contraste
                 if self.enable_contrast_enhancement:
-                    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-                    img = clahe.apply(img)
+                    if self._clahe is None:
+                        self._clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+                    self._clahe.apply(img, dst=buf)
+                    img, buf = buf, img
                 # Binarización
-                img = cv2.adaptiveThreshold(img, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 5)
-                # Deskew básico
+                if not self.uneven_lighting:
+                    # Otsu: una sola pasada de histograma, calidad comparable
+                    # al umbral adaptativo sobre páginas bien iluminadas
+                    cv2.threshold(img, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU, dst=buf)
+                    img, buf = buf, img
+                elif not self.enable_contrast_enhancement and _get_fused_kernel() is not None:
+                    # Sin CLAHE el umbral + apertura pueden fusionarse en un
+                    # kernel Numba (opcional) que evita el despacho de cv2
+                    img = _get_fused_kernel()(np.ascontiguousarray(img), 31, 5)
+                else:
+                    cv2.adaptiveThreshold(img, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 5, dst=buf)
+                    img, buf = buf, img
+                # Deskew por perfil de proyección sobre una miniatura: el
+                # ángulo se estima a bajo coste y solo la corrección final
+                # toca la imagen a resolución completa
                 if self.enable_deskewing:
-                    coords = cv2.findNonZero(255 - img)
-                    if coords is not None:
-                        rect = cv2.minAreaRect(coords)
-                        angle = rect[-1]
-                        if angle < -45:
-                            angle = -(90 + angle)
-                        else:
-                            angle = -angle
+                    angle = _estimate_skew_fast(img)
+                    # Rotar solo cuando el ángulo es perceptible: la
+                    # rotación (warpAffine) es la etapa más cara
+                    if abs(angle) > 0.5:
                         (h, w) = img.shape[:2]
                         M = cv2.getRotationMatrix2D((w // 2, h // 2), angle, 1.0)
                         img = cv2.warpAffine(img, M, (w, h), flags=cv2.INTER_CUBIC, borderMode=cv2.BORDER_REPLICATE)
                 
-                texto = pytesseract.image_to_string(img, lang="spa")
+                # pytesseract acepta ndarrays directamente, así que no hay
+                # conversión de vuelta a PIL por necesidad: la única que se
+                # hace es el empaquetado deliberado a 1 bpp, donde Pillow
+                # serializa como PBM y cruzan la frontera hacia Tesseract
+                # 8× menos bytes que con el uint8 {0,255}. Sin dithering:
+                # el Floyd-Steinberg por defecto convertiría en moteado los
+                # grises de borde que el warp INTER_CUBIC del deskew
+                # reintroduce tras la binarización
+                packed = Image.fromarray(img).convert(
+                    "1", dither=Image.Dither.NONE
+                )
+                texto = pytesseract.image_to_string(packed, lang="spa")
             except Exception:
                 texto = ""
             textos.append(texto.strip())
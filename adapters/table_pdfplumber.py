@@ -6,13 +6,135 @@ Este módulo implementa el puerto TableExtractorPort utilizando pdfplumber,
 una librería especializada en análisis estructural de documentos PDF que
 puede detectar y extraer tablas manteniendo su formato original.
 """
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Any
-import importlib
+from typing import List, Any, Sequence
 
 from application.ports import TableExtractorPort
 
 
+# Estrategia "lines": usa solo las reglas dibujadas del PDF y evita el
+# clustering de texto de pdfminer, mucho más caro por página. Se intenta
+# primero; si la página no tiene tablas con bordes se recae en la
+# estrategia por defecto basada en texto.
+_LINES_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 3,
+}
+
+
+def _page_tables(page: Any) -> List[Any]:
+    """Extrae las tablas de una página, estrategia rápida primero."""
+    try:
+        tables = page.extract_tables(table_settings=_LINES_SETTINGS)
+        if tables:
+            return tables
+    except Exception:
+        pass
+    return page.extract_tables() or []
+
+
+def _plausible_shape(table: Sequence[Any]) -> int:
+    """
+    Pre-filtro dimensional sobre la tabla cruda.
+
+    Replica la puerta de forma de ``_is_valid_table`` antes de materializar
+    ningún DataFrame: las detecciones 1×N / N×1 (ruido frecuente en PDFs
+    escaneados) se descartan con dos ``len`` en lugar de pagar un
+    ``DataFrame.__init__`` que va a rechazarse igual.
+
+    Retorna el ancho en columnas si la forma es plausible, 0 si no (el
+    ancho se reutiliza al construir el array, evitando un segundo barrido
+    de las filas).
+    """
+    rows = len(table)
+    if rows < 2:
+        return 0
+    cols = max((len(r) for r in table), default=0)
+    if cols < 2 or rows * cols < 8:
+        return 0
+    return cols
+
+
+def _intern_cells(tables: Sequence[Any]) -> None:
+    """
+    Deduplica in situ los strings de celda de un lote de tablas crudas.
+
+    Las tablas de PDFs reales repiten masivamente los mismos valores
+    (cabeceras, códigos, fechas) y cada celda llega como un ``str`` nuevo —
+    más aún tras cruzar el pickling del pool, que desduplica nada. Un pool
+    por extracción colapsa las repeticiones a una única instancia
+    compartida: ~50 bytes ahorrados por objeto evitado, a coste de un
+    ``setdefault`` por celda.
+    """
+    pool: "dict[str, str]" = {}
+    setdefault = pool.setdefault
+    for table in tables:
+        for row in table:
+            for i, cell in enumerate(row):
+                if type(cell) is str:
+                    row[i] = setdefault(cell, cell)
+
+
+def _records_to_frame(pd: Any, table: Sequence[Any], cols: int = 0) -> Any:
+    """
+    Convierte una tabla cruda (lista de filas) en DataFrame sin copias.
+
+    Rellena un único ndarray object de forma conocida (filas cortas quedan
+    en ``None``) y se lo entrega a pandas con ``copy=False``: un solo
+    bloque, sin la consolidación fila a fila del constructor genérico.
+    ``cols`` permite reutilizar el ancho ya medido por el pre-filtro.
+    """
+    try:
+        import numpy as np  # type: ignore
+
+        rows = len(table)
+        if cols <= 0:
+            cols = max((len(r) for r in table), default=0)
+        arr = np.empty((rows, cols), dtype=object)
+        for i, row in enumerate(table):
+            arr[i, : len(row)] = row
+        return pd.DataFrame(arr, copy=False)
+    except Exception:
+        return pd.DataFrame.from_records(table, coerce_float=False)
+
+
+def _extract_pages(path: str, page_numbers: Sequence[int]) -> List[Any]:
+    """
+    Extrae las tablas crudas (listas anidadas) de un rango de páginas.
+
+    Definida a nivel de módulo para ser picklable por el pool de procesos;
+    cada worker abre el PDF una sola vez para su trozo (los objetos de
+    pdfplumber no cruzan procesos) y retorna listas Python planas.
+    Retorna vacío ante cualquier fallo para no abortar el lote completo.
+    """
+    try:
+        try:
+            import pdfplumber_rs as pdfplumber  # type: ignore
+        except Exception:
+            import pdfplumber  # type: ignore
+
+        tables: List[Any] = []
+        # laparams=None omite el análisis de flujo de texto de pdfminer,
+        # innecesario cuando solo se extraen tablas
+        with pdfplumber.open(path, laparams=None) as pdf:
+            for num in page_numbers:
+                page = pdf.pages[num]
+                tables.extend(_page_tables(page))
+                # Liberar los objetos de layout cacheados de la página ya
+                # procesada: sin esto el RSS crece linealmente con el PDF
+                try:
+                    page.flush_cache()
+                except Exception:
+                    pass
+        return tables
+    except Exception:
+        return []
+
+
 class PdfPlumberAdapter(TableExtractorPort):
     """
     Adaptador para extracción de tablas que utiliza pdfplumber.
@@ -21,38 +143,208 @@ class PdfPlumberAdapter(TableExtractorPort):
     dependencias pesadas durante importación del módulo ni en tests.
     """
 
+    # Módulos resueltos una sola vez por proceso: find_spec recorre la
+    # cadena de finders en cada llamada, así que el resultado del primer
+    # intento (módulo o None) se cachea a nivel de clase
+    _pdfplumber: Any = None
+    _pandas: Any = None
+    _resolved: bool = False
+
+    def __init__(self, *, use_arrow: bool = False) -> None:
+        # Salida columnar opcional: con pyarrow instalado y el flag activo,
+        # las tablas validadas se entregan como RecordBatch (buffer de
+        # strings contiguo, sin el block manager de pandas). Desactivado
+        # por defecto porque el resto del pipeline consume DataFrames.
+        self.use_arrow = use_arrow
+        # Memoización por (ruta, mtime_ns, tamaño): los reintentos del
+        # pipeline vuelven a pedir el mismo PDF y el surrogate del stat
+        # detecta cualquier reescritura sin hashear el contenido. Los dicts
+        # preservan orden de inserción, así que la evicción FIFO es el
+        # primer elemento.
+        self._cache: "dict[tuple, List[Any]]" = {}
+
+    _CACHE_MAX = 32
+
+    # Proporción máxima de celdas vacías (None o "") tolerada por tabla;
+    # compartida por el camino vectorizado y el fallback duck-typed
+    _MAX_EMPTY_RATIO = 0.6
+
+    @classmethod
+    def _resolve_modules(cls) -> None:
+        """Importa pdfplumber y pandas una única vez, tolerando su ausencia."""
+        if cls._resolved:
+            return
+        try:
+            # pdfplumber-rs reimplementa la misma API (open/pages/
+            # extract_tables) sobre Rust: si está instalado, los bucles de
+            # geometría por carácter salen del intérprete
+            try:
+                import pdfplumber_rs as pdfplumber  # type: ignore
+            except Exception:
+                import pdfplumber  # type: ignore
+            import pandas  # type: ignore
+
+            cls._pdfplumber = pdfplumber
+            cls._pandas = pandas
+        except Exception:
+            cls._pdfplumber = None
+            cls._pandas = None
+        cls._resolved = True
+
     def extract_tables(self, pdf_path: Path) -> List[Any]:
         """
         Extrae todas las tablas detectadas en un documento PDF.
-        
+
         Si pdfplumber o pandas no están disponibles, retorna una lista vacía
         sin fallar.
         """
-        # Verificar disponibilidad de dependencias
-        if importlib.util.find_spec('pdfplumber') is None or importlib.util.find_spec('pandas') is None:
+        # Verificar disponibilidad de dependencias (resueltas una sola vez)
+        self._resolve_modules()
+        if self._pdfplumber is None or self._pandas is None:
             return []
-        
-        pdfplumber = importlib.import_module('pdfplumber')
-        pd = importlib.import_module('pandas')
 
-        dfs: List[Any] = []
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    tables = page.extract_tables() or []
-                    for table in tables:
+            st = os.stat(pdf_path)
+            cache_key = (os.fspath(pdf_path), st.st_mtime_ns, st.st_size)
+        except (OSError, TypeError):
+            cache_key = None
+        if cache_key is not None and cache_key in self._cache:
+            return self._cache[cache_key]
+
+        pdfplumber = self._pdfplumber
+        pd = self._pandas
+
+        # El análisis de pdfminer es CPU-bound y trivialmente paralelo por
+        # página: con varias páginas y núcleos, los trozos contiguos se
+        # reparten entre procesos worker y el padre solo envuelve los
+        # resultados (listas picklables) en DataFrames
+        raw_tables: List[Any] = []
+        # Selección de estrategia por tamaño de entrada: para PDFs pequeños
+        # el arranque del pool (fork + import de pdfplumber por worker)
+        # cuesta más que el propio análisis, así que se fuerzan en serie
+        try:
+            small_file = os.path.getsize(pdf_path) < 512 * 1024
+        except OSError:
+            small_file = False
+        try:
+            with pdfplumber.open(pdf_path, laparams=None) as pdf:
+                n_pages = len(pdf.pages)
+                # Dentro de un worker del lote ("Procesar todos") el
+                # paralelismo ya viene dado por documento: forzar la ruta
+                # serie evita anidar otro pool por cada PDF de 10+ páginas
+                if os.environ.get("OCR_CLI_POOL_WORKER"):
+                    workers = 1
+                else:
+                    workers = min(os.cpu_count() or 1, n_pages)
+                if workers <= 1 or n_pages < 10 or small_file:
+                    for page in pdf.pages:
+                        raw_tables.extend(_page_tables(page))
+                        # El caché de layout de cada página no se vuelve a
+                        # usar: vaciarlo mantiene el RSS acotado por página
+                        # en lugar de por documento
                         try:
-                            df = pd.DataFrame(table)
-                            if self._is_valid_table(df):
-                                dfs.append(df)
+                            page.flush_cache()
                         except Exception:
-                            # Si una tabla falla al convertir, continuar con el resto
-                            continue
+                            pass
+                    workers = 0  # ya extraído en serie
         except Exception:
             # Si el PDF está corrupto o no se puede abrir, retornar vacío
             return []
+
+        if workers > 1:
+            size = -(-n_pages // workers)
+            chunks = [
+                list(range(start, min(start + size, n_pages)))
+                for start in range(0, n_pages, size)
+            ]
+            # Con el backend Rust los bucles de geometría liberan el GIL:
+            # bastan hilos, que evitan el fork y el pickling entre procesos
+            if getattr(pdfplumber, "__name__", "") == "pdfplumber_rs":
+                pool_cls = ThreadPoolExecutor
+            else:
+                pool_cls = ProcessPoolExecutor
+            try:
+                with pool_cls(max_workers=workers) as executor:
+                    raw_tables = [
+                        table
+                        for lote in executor.map(
+                            partial(_extract_pages, str(pdf_path)), chunks
+                        )
+                        for table in lote
+                    ]
+            except Exception:
+                # Sin pool disponible (p. ej. entorno sin fork): en serie
+                raw_tables = _extract_pages(str(pdf_path), range(n_pages))
+
+        # Compartir identidad entre celdas repetidas antes de construir los
+        # DataFrames: los arrays object referencian las mismas instancias
+        try:
+            _intern_cells(raw_tables)
+        except Exception:
+            pass
+
+        dfs: List[Any] = []
+        for table in raw_tables:
+            try:
+                cols = _plausible_shape(table)
+                if not cols:
+                    continue
+                # pdfplumber siempre entrega list[list[str | None]]: no hay
+                # tipos que inferir y el array object único evita la
+                # consolidación por bloques del constructor genérico
+                df = _records_to_frame(pd, table, cols)
+                if self._is_valid_table(df):
+                    dfs.append(df)
+            except Exception:
+                # Si una tabla falla al convertir, continuar con el resto
+                continue
+        if self.use_arrow and dfs:
+            try:
+                import pyarrow as pa  # type: ignore
+
+                dfs = [pa.RecordBatch.from_pandas(df) for df in dfs]
+            except Exception:
+                pass
+        if cache_key is not None:
+            if len(self._cache) >= self._CACHE_MAX:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[cache_key] = dfs
         return dfs
     
+    def iter_tables(self, pdf_path: Path):
+        """
+        Genera los DataFrames validados página a página, en orden.
+
+        Variante streaming de ``extract_tables``: cada página se procesa,
+        se vacía su caché de layout y sus tablas se entregan antes de tocar
+        la siguiente, de modo que la memoria pico queda acotada por una
+        página (más la tabla en curso) en lugar de por el documento entero.
+        Útil para que el almacenamiento persista incrementalmente.
+        """
+        self._resolve_modules()
+        if self._pdfplumber is None or self._pandas is None:
+            return
+        pd = self._pandas
+        try:
+            with self._pdfplumber.open(pdf_path, laparams=None) as pdf:
+                for page in pdf.pages:
+                    for table in _page_tables(page):
+                        cols = _plausible_shape(table)
+                        if not cols:
+                            continue
+                        try:
+                            df = _records_to_frame(pd, table, cols)
+                        except Exception:
+                            continue
+                        if self._is_valid_table(df):
+                            yield df
+                    try:
+                        page.flush_cache()
+                    except Exception:
+                        pass
+        except Exception:
+            return
+
     def _is_valid_table(self, df: Any) -> bool:
         """Heurísticas simples para descartar tablas triviales."""
         try:
@@ -64,6 +356,16 @@ class PdfPlumberAdapter(TableExtractorPort):
             total_cells = rows * cols
             if total_cells < 8:
                 return False
+            # Camino vectorizado: una sola pasada C sobre el buffer
+            # subyacente en lugar de dos reducciones pandas (isnull + ==)
+            # que materializan cada una un intermedio del tamaño de la tabla
+            if self._pandas is not None:
+                try:
+                    vals = df.to_numpy(copy=False)
+                    vacios = (self._pandas.isna(vals) | (vals == '')).mean()
+                    return float(vacios) <= self._MAX_EMPTY_RATIO
+                except Exception:
+                    pass
             # Conteo de vacíos (duck-typing compatible)
             isnull = getattr(df, 'isnull', None)
             empty_cells = 0
@@ -81,7 +383,7 @@ class PdfPlumberAdapter(TableExtractorPort):
                     empty_cells += int(eq_empty.sum())
                 except Exception:
                     pass
-            if total_cells > 0 and empty_cells / total_cells > 0.6:
+            if total_cells > 0 and empty_cells / total_cells > self._MAX_EMPTY_RATIO:
                 return False
             return True
         except Exception:
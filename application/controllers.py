@@ -5,7 +5,8 @@ Este módulo contiene la lógica de coordinación de alto nivel que orquesta
 los casos de uso sin depender de detalles de interfaz específicos.
 """
 
-import time
+import os
+from time import perf_counter_ns
 from pathlib import Path
 from typing import Tuple, List, Dict, Any
 
@@ -35,6 +36,13 @@ class DocumentController:
         """
         self.pdf_dir = pdf_dir
         self.output_dir = output_dir
+        # Adaptadores cacheados por sesión: el de tablas y el de storage no
+        # dependen de la configuración y reutilizarlos conserva además sus
+        # cachés internas (extracciones memoizadas por mtime del PDF); los
+        # de OCR se memorizan por configuración
+        self._table_adapter = None
+        self._storage_adapter = None
+        self._ocr_adapters: Dict[tuple, Any] = {}
     
     def process_document(
         self, 
@@ -59,21 +67,40 @@ class DocumentController:
             2.34
         """
         pdf_path = self.pdf_dir / filename
-        
-        # Validar que el archivo existe
-        if not pdf_path.exists():
+
+        # Validar existencia y tamaño con un único stat: un archivo de
+        # 0 bytes no puede ser un PDF, y descartarlo aquí evita construir
+        # toda la cadena de adaptadores para fallar dentro del pipeline
+        try:
+            tamano = os.stat(pdf_path).st_size
+        except OSError:
             return False, {
                 "error": f"Archivo {filename} no encontrado",
                 "filename": filename,
                 "processing_time": 0
             }
+        if tamano == 0:
+            return False, {
+                "error": f"Archivo {filename} vacío (0 bytes)",
+                "filename": filename,
+                "processing_time": 0
+            }
         
-        start_time = time.time()
+        # perf_counter_ns es monotónico (inmune a ajustes del reloj) y de
+        # mayor resolución que time.time; la resta de enteros en ns no
+        # arrastra el error de redondeo de dos dobles y la conversión a
+        # segundos se hace una sola vez al ensamblar el resultado
+        start_ns = perf_counter_ns()
         try:
-            # Configurar adaptadores basado en la configuración
-            ocr_adapter = self._create_ocr_adapter(ocr_config)
-            table_adapter = PdfPlumberAdapter()
-            storage_adapter = FileStorage(self.output_dir)
+            # Configurar adaptadores basado en la configuración,
+            # reutilizando las instancias ya construidas en esta sesión
+            ocr_adapter = self._get_ocr_adapter(ocr_config)
+            if self._table_adapter is None:
+                self._table_adapter = PdfPlumberAdapter()
+            if self._storage_adapter is None:
+                self._storage_adapter = FileStorage(self.output_dir)
+            table_adapter = self._table_adapter
+            storage_adapter = self._storage_adapter
             
             # Crear caso de uso
             processor = ProcessDocument(
@@ -85,13 +112,17 @@ class DocumentController:
             # Ejecutar procesamiento
             result = processor(pdf_path)
             
-            # Verificar si es una tupla con 2 elementos
-            if isinstance(result, tuple) and len(result) == 2:
+            # Desempaquetado directo: el propio unpack valida aridad y tipo
+            # sin el isinstance + len previos (EAFP; la ruta feliz no paga
+            # comprobaciones redundantes)
+            try:
                 texto_principal, archivos_generados = result
-            else:
-                raise ValueError(f"ProcessDocument retornó {type(result)} en lugar de tupla de 2 elementos: {result}")
+            except (TypeError, ValueError):
+                raise ValueError(
+                    f"ProcessDocument retornó {type(result)} en lugar de tupla de 2 elementos: {result}"
+                )
                 
-            processing_time = time.time() - start_time
+            processing_time = (perf_counter_ns() - start_ns) / 1e9
             
             return True, {
                 "filename": filename,
@@ -104,7 +135,7 @@ class DocumentController:
             }
             
         except Exception as e:
-            processing_time = time.time() - start_time if 'start_time' in locals() else 0
+            processing_time = (perf_counter_ns() - start_ns) / 1e9 if 'start_ns' in locals() else 0
             return False, {
                 "filename": filename,
                 "processing_time": processing_time,
@@ -113,6 +144,27 @@ class DocumentController:
                 "ocr_config": ocr_config
             }
     
+    def _get_ocr_adapter(self, config: OCRConfig):
+        """
+        Retorna el adaptador OCR para ``config``, reutilizando instancias.
+
+        Los adaptadores son puros respecto a su configuración, así que la
+        clave (motor + flags) identifica la instancia; repetir el mismo
+        motor en varios documentos no vuelve a pagar su inicialización.
+        """
+        clave = (
+            config.engine_type,
+            config.enable_deskewing,
+            config.enable_denoising,
+            config.enable_contrast_enhancement,
+            config.input_is_scan,
+        )
+        adapter = self._ocr_adapters.get(clave)
+        if adapter is None:
+            adapter = self._create_ocr_adapter(config)
+            self._ocr_adapters[clave] = adapter
+        return adapter
+
     def _create_ocr_adapter(self, config: OCRConfig):
         """
         Crea el adaptador OCR apropiado basado en la configuración.
@@ -124,12 +176,16 @@ class DocumentController:
             OCRPort: Adaptador OCR configurado
         """
         if config.engine_type == "basic":
-            return TesseractAdapter()
+            # La caché por hash de contenido vive junto a los resultados:
+            # sin un directorio el adaptador la desactiva y reprocesar el
+            # mismo PDF volvería a pagar el OCR completo
+            return TesseractAdapter(cache_dir=self.output_dir / ".ocr_cache")
         elif config.engine_type == "opencv":
             return TesseractOpenCVAdapter(
                 enable_deskewing=config.enable_deskewing,
                 enable_denoising=config.enable_denoising,
-                enable_contrast_enhancement=config.enable_contrast_enhancement
+                enable_contrast_enhancement=config.enable_contrast_enhancement,
+                input_is_scan=config.input_is_scan,
             )
         else:
             raise ValueError(f"Tipo de motor OCR no soportado: {config.engine_type}")
@@ -14,7 +14,7 @@ Principios aplicados:
 """
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Any
+from typing import List, Any, Tuple
 
 
 class OCRPort(ABC):
@@ -123,6 +123,34 @@ class TableExtractorPort(ABC):
         ...
 
 
+class CombinedExtractorPort(ABC):
+    """
+    Puerto opcional para adaptadores que fusionan OCR y extracción de tablas.
+
+    Un adaptador que implemente este puerto puede abrir y recorrer el PDF
+    una sola vez produciendo ambos resultados, en lugar de pagar dos pasadas
+    completas de parseo (una por ``extract_text`` y otra por
+    ``extract_tables``). Los casos de uso lo detectan por ``isinstance`` y
+    prefieren la llamada fusionada cuando está disponible; los adaptadores
+    existentes no necesitan implementarlo.
+    """
+
+    @abstractmethod
+    def extract(self, pdf_path: Path) -> Tuple[str, List[Any]]:
+        """
+        Extrae texto y tablas de un PDF en una única pasada.
+
+        Args:
+            pdf_path (Path): Ruta absoluta al archivo PDF a procesar
+
+        Returns:
+            Tuple[str, List[Any]]: Texto completo extraído y lista de tablas,
+                                   con la misma semántica que los puertos
+                                   individuales.
+        """
+        ...
+
+
 class StoragePort(ABC):
     """
     Puerto (interfaz) para servicios de persistencia de resultados procesados.
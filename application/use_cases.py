@@ -13,10 +13,17 @@ Principios aplicados:
 - Clean Architecture: Aislamiento de la lógica de negocio
 - Command Pattern: Casos de uso como comandos ejecutables
 """
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple, List, Any
+from typing import Tuple, List, Any, Union
 
-from application.ports import OCRPort, TableExtractorPort, StoragePort
+from application.ports import (
+    OCRPort,
+    TableExtractorPort,
+    StoragePort,
+    CombinedExtractorPort,
+)
 from domain.models import Document
 
 
@@ -78,8 +85,14 @@ class ProcessDocument:
         self.ocr = ocr
         self.table_extractor = table_extractor
         self.storage = storage
+        # Despacho estructural resuelto una sola vez: el isinstance (walk
+        # del MRO + caché de ABC) se paga aquí y no en cada documento; en
+        # __call__ queda una comparación contra None y una llamada ligada
+        self._fused_extract = (
+            ocr.extract if isinstance(ocr, CombinedExtractorPort) else None
+        )
 
-    def __call__(self, pdf_path: Path) -> Tuple[str, List[str]]:
+    def __call__(self, pdf_path: Union[str, "os.PathLike[str]"]) -> Tuple[str, List[str]]:
         """
         Ejecuta el procesamiento completo de un documento PDF.
         
@@ -99,8 +112,9 @@ class ProcessDocument:
         5. Retorno de las rutas reales de archivos generados
         
         Args:
-            pdf_path (Path): Ruta absoluta al archivo PDF a procesar.
-                            Debe existir y ser legible.
+            pdf_path: Ruta absoluta al archivo PDF a procesar (``Path``,
+                      ``str`` o cualquier ``os.PathLike``). Debe existir
+                      y ser legible.
         
         Returns:
             Tuple[str, List[str]]: Tupla con:
@@ -132,15 +146,40 @@ class ProcessDocument:
             - Extracción de tablas es más rápida (análisis estructural)
             - El tiempo total depende de: resolución DPI, número de páginas, complejidad
         """
-        # ETAPA 1: Extracción de texto mediante OCR
-        # Esta es típicamente la operación más lenta del proceso
-        # El tiempo depende de: número de páginas, resolución DPI, complejidad del texto
-        text: str = self.ocr.extract_text(pdf_path)
-        
-        # ETAPA 2: Extracción de tablas estructuradas
-        # Análisis paralelo e independiente del OCR
-        # Más rápido que OCR pues analiza estructura vectorial del PDF
-        tables: List[Any] = self.table_extractor.extract_tables(pdf_path)
+        # Normalización única en la frontera: los llamadores pueden pasar
+        # str o PathLike y la conversión a Path ocurre exactamente una vez
+        # aquí, en lugar de repetirse dentro de cada adaptador
+        if not isinstance(pdf_path, Path):
+            pdf_path = Path(os.fspath(pdf_path))
+
+        # ETAPA 0: Descarte rápido de PDFs degenerados
+        # Un PDF por debajo de ~1 KB no puede contener páginas con contenido
+        # (la cabecera, el trailer y un objeto página mínimo ya superan ese
+        # tamaño); devolver vacío aquí evita arrancar OCR y extracción de
+        # tablas — con sus pools y subprocesos — para no producir nada
+        try:
+            if pdf_path.stat().st_size < 1024:
+                return "", []
+        except OSError:
+            pass
+
+        # ETAPA 1 y 2: Extracción de texto y tablas
+        # Si el adaptador de OCR implementa el puerto fusionado, ambos
+        # resultados salen de una única apertura y recorrido del PDF
+        # (la mitad del trabajo de parseo en documentos grandes)
+        if self._fused_extract is not None:
+            text, tables = self._fused_extract(pdf_path)
+        else:
+            # OCR y tablas son independientes entre sí y ambos delegan el
+            # trabajo pesado fuera del intérprete (subprocesos de Tesseract/
+            # poppler, código C de pdfminer), así que se solapan: el OCR —
+            # típicamente la etapa más lenta — corre en un hilo mientras
+            # este hilo extrae las tablas, y la latencia total queda en
+            # max(T_ocr, T_tablas) en lugar de la suma
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                futuro_texto = pool.submit(self.ocr.extract_text, pdf_path)
+                tables = self.table_extractor.extract_tables(pdf_path)
+                text = futuro_texto.result()
 
         # ETAPA 3: Persistencia atómica de resultados en carpeta organizada
         # Guarda todos los resultados de forma consistente en una carpeta dedicada
@@ -148,10 +187,14 @@ class ProcessDocument:
         archivos_generados: List[str] = self.storage.save(pdf_path.stem, text, tables, pdf_path)
 
         # ETAPA 4: Identificación del archivo principal
-        # El archivo de texto completo es el resultado principal
-        texto_principal = next(
-            (archivo for archivo in archivos_generados if archivo.endswith("texto_completo.txt")),
-            archivos_generados[0] if archivos_generados else ""
-        )
+        # Los almacenamientos que retornan SaveResult ya lo anotaron en
+        # O(1); para listas planas (otros adaptadores, mocks) se conserva
+        # el rastreo lineal por sufijo
+        texto_principal = getattr(archivos_generados, "main", "")
+        if not texto_principal:
+            texto_principal = next(
+                (archivo for archivo in archivos_generados if archivo.endswith("texto_completo.txt")),
+                archivos_generados[0] if archivos_generados else ""
+            )
         
         return texto_principal, archivos_generados
\ No newline at end of file
@@ -3,13 +3,13 @@
 Módulo de configuración para el sistema OCR mejorado.
 """
 
-from .enhanced_config import (
+from .system_config import (
     EnhancedSystemConfig,
     OCRConfig,
     PreprocessingConfig,
     QualityConfig,
     ProcessingConfig,
-    QUALITY_PROFILES,
+    get_quality_profile,
     load_config_from_file,
     save_config_to_file
 )
@@ -21,6 +21,16 @@ __all__ = [
     'QualityConfig',
     'ProcessingConfig',
     'QUALITY_PROFILES',
+    'get_quality_profile',
     'load_config_from_file',
     'save_config_to_file'
 ]
+
+
+def __getattr__(name: str):
+    """Delegación perezosa: no materializar los perfiles en el import."""
+    if name == 'QUALITY_PROFILES':
+        from . import system_config
+
+        return system_config.QUALITY_PROFILES
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,16 +1,17 @@
-# config/enhanced_config.py
+# config/system_config.py
 """
 Configuraciones para el sistema OCR mejorado.
 
 Este módulo centraliza todas las configuraciones del sistema mejorado,
 incluyendo parámetros de calidad, preprocesamiento y métricas.
 """
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from pathlib import Path
 
 
-@dataclass
+@dataclass(frozen=True)
 class OCRConfig:
     """Configuración para el motor de OCR."""
     language: str = "spa"
@@ -21,7 +22,7 @@ class OCRConfig:
     max_retry_attempts: int = 2
 
 
-@dataclass
+@dataclass(frozen=True)
 class PreprocessingConfig:
     """Configuración para el preprocesamiento de imágenes."""
     enable_skew_correction: bool = True
@@ -31,7 +32,7 @@ class PreprocessingConfig:
     quality_threshold_for_intensive_processing: float = 0.7
 
 
-@dataclass
+@dataclass(frozen=True)
 class QualityConfig:
     """Configuración para análisis de calidad."""
     min_acceptable_quality: float = 60.0
@@ -41,7 +42,7 @@ class QualityConfig:
     export_confidence_maps: bool = False
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProcessingConfig:
     """Configuración general de procesamiento."""
     enable_auto_retry: bool = True
@@ -52,24 +53,21 @@ class ProcessingConfig:
     table_quality_threshold: float = 0.5  # Umbral de calidad para incluir tablas
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EnhancedSystemConfig:
-    """Configuración completa del sistema mejorado."""
-    ocr: OCRConfig = None
-    preprocessing: PreprocessingConfig = None
-    quality: QualityConfig = None
-    processing: ProcessingConfig = None
-    
-    def __post_init__(self):
-        """Inicializa configuraciones por defecto si no se proporcionan."""
-        if self.ocr is None:
-            self.ocr = OCRConfig()
-        if self.preprocessing is None:
-            self.preprocessing = PreprocessingConfig()
-        if self.quality is None:
-            self.quality = QualityConfig()
-        if self.processing is None:
-            self.processing = ProcessingConfig()
+    """
+    Configuración completa del sistema mejorado.
+
+    Inmutable: los presets se usan en modo solo lectura, así que congelar
+    la instancia permite compartir el mismo objeto entre llamadores (ver
+    ``get_quality_profile``) y usarla como clave de diccionario. Los
+    sub-bloques usan ``default_factory`` en lugar del antiguo par
+    ``= None`` + ``__post_init__``, que requería mutar tras la creación.
+    """
+    ocr: OCRConfig = field(default_factory=OCRConfig)
+    preprocessing: PreprocessingConfig = field(default_factory=PreprocessingConfig)
+    quality: QualityConfig = field(default_factory=QualityConfig)
+    processing: ProcessingConfig = field(default_factory=ProcessingConfig)
     
     @classmethod
     def create_high_quality_config(cls) -> 'EnhancedSystemConfig':
@@ -271,9 +269,43 @@ def save_config_to_file(config: EnhancedSystemConfig, config_path: Path) -> bool
         return False
 
 
-# Configuraciones predefinidas para casos comunes
-QUALITY_PROFILES = {
-    'maximum_quality': EnhancedSystemConfig.create_high_quality_config(),
-    'fast_processing': EnhancedSystemConfig.create_fast_config(),
-    'balanced': EnhancedSystemConfig.create_balanced_config()
+# Fábricas de configuraciones predefinidas para casos comunes. Los perfiles
+# se materializan perezosamente: construir los tres en el import pagaba
+# cinco dataclasses por perfil aunque el llamador usara uno solo (o ninguno)
+_PROFILE_FACTORIES = {
+    'maximum_quality': EnhancedSystemConfig.create_high_quality_config,
+    'fast_processing': EnhancedSystemConfig.create_fast_config,
+    'balanced': EnhancedSystemConfig.create_balanced_config,
 }
+
+
+@functools.lru_cache(maxsize=None)
+def get_quality_profile(name: str) -> EnhancedSystemConfig:
+    """
+    Retorna el perfil de calidad predefinido ``name``.
+
+    El perfil se construye en el primer acceso y se cachea: llamadas
+    posteriores devuelven la misma instancia sin reconstruir nada.
+
+    Args:
+        name: Clave del perfil ('maximum_quality', 'fast_processing',
+              'balanced')
+
+    Returns:
+        EnhancedSystemConfig: Configuración del perfil solicitado
+
+    Raises:
+        KeyError: Si el perfil no existe
+    """
+    try:
+        factory = _PROFILE_FACTORIES[name]
+    except KeyError:
+        raise KeyError(f"Perfil de calidad desconocido: {name!r}")
+    return factory()
+
+
+def __getattr__(name: str):
+    """Mantiene ``QUALITY_PROFILES`` como atributo perezoso del módulo."""
+    if name == 'QUALITY_PROFILES':
+        return {key: get_quality_profile(key) for key in _PROFILE_FACTORIES}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,11 +12,18 @@ Principios aplicados:
 - Immutability: Modelos inmutables para garantizar consistencia
 - Type Safety: Uso de type hints para claridad y validación
 """
+import os.path
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Any, Dict, Optional
 from datetime import datetime
 
+# Patrón de palabra precompilado para contar sin materializar la lista de
+# substrings que produce str.split() (O(palabras) de memoria transitoria
+# sobre textos OCR de varios MB)
+_WORD_RE = re.compile(r"\S+")
+
 
 @dataclass
 class ProcessingMetrics:
@@ -73,7 +80,25 @@ class OCRResult:
         return self.quality_score >= 80.0
 
 
-@dataclass
+class SaveResult(list):
+    """
+    Lista de rutas generadas por el almacenamiento, con acceso O(1) al
+    archivo principal.
+
+    Subclase de ``list`` para mantener compatibilidad total con los
+    llamadores (y mocks) que tratan el retorno de ``save`` como una lista
+    de rutas; el atributo ``main`` evita que cada consumidor vuelva a
+    recorrer la lista buscando ``texto_completo.txt``.
+    """
+
+    __slots__ = ("main",)
+
+    def __init__(self, files: Optional[List[str]] = None, main: str = "") -> None:
+        super().__init__(files or [])
+        self.main = main
+
+
+@dataclass(slots=True)
 class Document:
     """
     Entidad que representa un documento procesado en el sistema.
@@ -94,54 +119,41 @@ class Document:
     - Persistencia en bases de datos
     - Análisis y transformación de contenido
     
+    Attributes:
+        name: Nombre identificador del documento. Generalmente corresponde
+            al nombre del archivo original sin extensión, pero puede ser
+            modificado por el usuario para mayor claridad semántica. Debe
+            ser único dentro del contexto de procesamiento.
+        source_path: Ruta al archivo PDF original en el sistema de
+            archivos. Mantiene la trazabilidad hacia el documento fuente,
+            permitiendo reprocesamiento y validación de integridad.
+        extracted_text: Texto completo extraído mediante OCR, preservando
+            la estructura de párrafos y separación entre páginas. Puede
+            contener errores típicos de OCR que requieren validación.
+        tables: Lista de tablas extraídas como DataFrames de pandas, con
+            la estructura de filas y columnas originales, listas para
+            análisis, exportación o transformación.
+        ocr_result: Resultado detallado del OCR con métricas de calidad.
+        processing_metadata: Metadatos adicionales del procesamiento.
+
     Future Extensions:
     - metadata: Dict con información adicional (fecha procesamiento, versión OCR, etc.)
     - pages: List[Page] para análisis granular por página
     - confidence_scores: Métricas de confianza del OCR
     - language: Idioma detectado del documento
     """
-    
+
     name: str
-    """
-    Nombre identificador del documento.
-    
-    Generalmente corresponde al nombre del archivo original sin extensión,
-    pero puede ser modificado por el usuario para mayor claridad semántica.
-    Debe ser único dentro del contexto de procesamiento.
-    """
-    
     source_path: Path
-    """
-    Ruta al archivo PDF original en el sistema de archivos.
-    
-    Mantiene la trazabilidad hacia el documento fuente, permitiendo
-    reprocesamiento si es necesario y validación de integridad.
-    """
-    
     extracted_text: str
-    """
-    Texto completo extraído del documento mediante OCR.
-    
-    Contiene todo el contenido textual identificado en el documento,
-    preservando la estructura de párrafos y separación entre páginas.
-    El texto puede contener errores típicos de OCR que requieren validación.
-    """
-    
     tables: List[Any]
-    """
-    Lista de tablas extraídas como DataFrames de pandas.
-    
-    Cada elemento representa una tabla detectada en el documento,
-    manteniendo la estructura de filas y columnas originales.
-    Las tablas están listas para análisis, exportación o transformación.
-    """
-    
+
     # Nuevos campos para métricas avanzadas
     ocr_result: Optional[OCRResult] = None
-    """Resultado detallado del OCR con métricas de calidad."""
-    
     processing_metadata: Dict[str, Any] = field(default_factory=dict)
-    """Metadatos adicionales del procesamiento."""
+
+    # Cache del conteo de palabras; el texto extraído no muta tras la creación
+    _word_count: Optional[int] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self) -> None:
         """
@@ -161,21 +173,29 @@ class Document:
             ValueError: Si alguna validación falla
             FileNotFoundError: Si el archivo fuente no existe
         """
-        # Validación: nombre debe ser válido para crear archivos
-        if not self.name or not self.name.strip():
-            raise ValueError("Document name cannot be empty")
-            
-        # Validación: texto debe estar inicializado (aunque esté vacío)
-        if self.extracted_text is None:
-            raise ValueError("Document text cannot be None")
-            
-        # Validación: lista de tablas debe estar inicializada
+        # Normalización (comportamiento, no validación): la lista de tablas
+        # debe quedar inicializada siempre, también bajo python -O
         if self.tables is None:
             self.tables = []
-            
-        # Validación: archivo fuente debe existir
-        if not self.source_path.exists():
-            raise FileNotFoundError(f"Source file not found: {self.source_path}")
+
+        # Validaciones defensivas: los llamadores acaban de calcular estos
+        # valores, así que bajo python -O (__debug__ es una constante de
+        # compilación) el bloque entero desaparece del bytecode — incluido
+        # el stat de lexists, uno menos por documento en lotes grandes
+        if __debug__:
+            # Validación: nombre debe ser válido para crear archivos
+            if not self.name or not self.name.strip():
+                raise ValueError("Document name cannot be empty")
+
+            # Validación: texto debe estar inicializado (aunque esté vacío)
+            if self.extracted_text is None:
+                raise ValueError("Document text cannot be None")
+
+            # Validación: archivo fuente debe existir. lexists evita el
+            # seguimiento de symlinks y la construcción del stat_result que
+            # Path.exists() paga por llamada
+            if not os.path.lexists(self.source_path):
+                raise FileNotFoundError(f"Source file not found: {self.source_path}")
     
     @property
     def has_tables(self) -> bool:
@@ -185,7 +205,9 @@ class Document:
         Returns:
             bool: True si se detectaron y extrajeron tablas, False en caso contrario
         """
-        return len(self.tables) > 0
+        # Truthiness directa de la lista: una comprobación en C en lugar de
+        # len() + comparación
+        return bool(self.tables)
     
     @property
     def table_count(self) -> int:
@@ -210,7 +232,18 @@ class Document:
         Returns:
             int: Número aproximado de palabras en el texto
         """
-        return len(self.extracted_text.split()) if self.extracted_text else 0
+        # finditer recorre el texto en C entregando un match a la vez: el
+        # conteo nunca materializa las palabras, a diferencia de split().
+        # El resultado se memoriza a mano (cached_property no funciona con
+        # slots=True): recorrer varios MB de texto una sola vez basta
+        if self._word_count is None:
+            if self.extracted_text:
+                self._word_count = sum(
+                    1 for _ in _WORD_RE.finditer(self.extracted_text)
+                )
+            else:
+                self._word_count = 0
+        return self._word_count
     
     @property
     def quality_score(self) -> Optional[float]:
@@ -20,20 +20,23 @@ Lógica de negocio delegada a:
 - application.controllers: Coordinación de casos de uso
 """
 
+import functools
+import os
+import sys
+import threading
 from pathlib import Path
 from typing import List, Optional
 
-from utils.file_utils import discover_pdf_files, validate_pdf_exists
+from utils.file_utils import discover_pdf_files
 from utils.menu_logic import (
-    create_pdf_menu_options, 
-    get_selected_pdf, 
+    create_pdf_menu_options,
+    get_selected_pdf,
     is_exit_selection,
+    is_process_all_selection,
     create_ocr_config_from_user_choices,
-    validate_ocr_engine_choice,
     OCRConfig,
     total_menu_options_count,
 )
-from application.controllers import DocumentController
 
 # Configuración de directorios Docker
 # Estos paths son montados como volúmenes en docker-compose.yml
@@ -41,15 +44,123 @@ PDF_DIR = Path("/app/pdfs")        # Directorio de entrada (host: ./pdfs)
 OUT_DIR = Path("/app/resultado")   # Directorio de salida (host: ./resultado)
 
 
+@functools.lru_cache(maxsize=4)
+def _render_menu(pdf_files_key: tuple) -> str:
+    """
+    Retorna el bloque de menú ya formateado para una lista de PDFs.
+
+    En el bucle interactivo el listado rara vez cambia entre iteraciones:
+    cachear el texto renderizado por tupla de nombres convierte el
+    re-render en una búsqueda de hash más un write, sin reformatear las
+    O(N) opciones cada vez.
+    """
+    lines = ["Selecciona un PDF para procesar:"]
+    lines.extend(
+        option.text for option in create_pdf_menu_options(list(pdf_files_key))
+    )
+    # "Procesar todos" va tras "Salir" para no renumerar las opciones
+    # existentes que dependen de la posición histórica de la salida
+    lines.append(f"{len(pdf_files_key) + 2}. Procesar todos")
+    lines.append(_DASH_BAR)
+    return "\n".join(lines) + "\n"
+
+# Respuestas afirmativas aceptadas en prompts s/n. frozenset precompilado:
+# la comprobación es una búsqueda de hash y el strip tolera espacios
+# accidentales (" si") que startswith('s') aceptaba o rechazaba en silencio
+_YES = frozenset({'s', 'si', 'sí', 'y', 'yes'})
+
+# Etiquetas constantes indexables por bool (False -> 'NO', True -> 'SI')
+_SI_NO = ('NO', 'SI')
+
+# Barras y cabecera precomputadas: las construye el import una vez en
+# lugar de multiplicar cadenas en cada render
+_EQ_BAR = "=" * 50
+_DASH_BAR = "-" * 50
+_HEADER = f"\n{_EQ_BAR}\nOCR-CLI - Procesador de documentos PDF\n{_EQ_BAR}\n"
+
+
+def _yes(prompt: str) -> bool:
+    """Pregunta s/n y retorna True solo ante una respuesta afirmativa."""
+    return input(prompt).strip().lower() in _YES
+
+
+def _sniff_has_text(pdf_path: Path) -> bool:
+    """
+    Detecta barato si el PDF trae capa de texto nativa.
+
+    Abre solo la primera página con pdfplumber y comprueba la veracidad
+    del texto extraído; suficiente para distinguir un PDF nativo de un
+    escaneo sin recorrer el documento. Ante cualquier fallo (dependencia
+    ausente, PDF corrupto) se asume escaneo, el caso que más trabajo
+    de OCR requiere.
+    """
+    try:
+        import pdfplumber  # type: ignore
+
+        with pdfplumber.open(pdf_path, laparams=None) as pdf:
+            return bool(pdf.pages[0].extract_text())
+    except Exception:
+        return False
+
+
+def _with_progress(accion):
+    """
+    Ejecuta ``accion()`` mostrando el tiempo transcurrido cada medio segundo.
+
+    El OCR puede tardar minutos sin emitir nada; un hilo daemon imprime un
+    contador sobre la misma línea para que el usuario sepa que el proceso
+    sigue vivo. El hilo no roba CPU real: el trabajo pesado ocurre en
+    código nativo (Tesseract, OpenCV, pdfminer) que libera el GIL.
+    """
+    done = threading.Event()
+
+    def _tick() -> None:
+        ticks = 0
+        while not done.wait(0.5):
+            ticks += 1
+            sys.stdout.write(f"\r  procesando... {ticks * 0.5:.1f}s")
+            sys.stdout.flush()
+
+    hilo = threading.Thread(target=_tick, daemon=True)
+    hilo.start()
+    try:
+        return accion()
+    finally:
+        done.set()
+        hilo.join()
+        # Borrar la línea del contador antes del resumen
+        sys.stdout.write("\r" + " " * 40 + "\r")
+        sys.stdout.flush()
+
+
+def _read_choice(prompt: str, lo: int, hi: int) -> int:
+    """
+    Lee un entero en [lo, hi] reintentando hasta obtener uno válido.
+
+    isdigit() descarta la entrada no numérica con un recorrido en C antes
+    de llamar a int(), así que la ruta de error no paga la maquinaria de
+    excepciones de un ValueError por cada pulsación equivocada.
+    """
+    # Builtins ligados a locales: LOAD_FAST en lugar de LOAD_GLOBAL en
+    # cada vuelta del único bucle de estado estable de la interfaz
+    input_, int_, print_ = input, int, print
+    while True:
+        raw = input_(prompt).strip()
+        if raw.isdigit():
+            choice = int_(raw)
+            if lo <= choice <= hi:
+                return choice
+        print_(f"Opción inválida. Ingresa un número entre {lo} y {hi}.")
+
+
 def display_welcome_message() -> None:
     """
     Muestra mensaje de bienvenida y título de la aplicación.
     
     Función pura de presentación sin lógica de negocio.
     """
-    print("\n" + "="*50)
-    print("OCR-CLI - Procesador de documentos PDF")
-    print("="*50)
+    # Bloque completo en un único write: un syscall en lugar de tres
+    sys.stdout.write(_HEADER)
 
 
 def display_pdf_menu(pdf_files: List[str]) -> None:
@@ -63,13 +174,11 @@ def display_pdf_menu(pdf_files: List[str]) -> None:
         Función pura de presentación. La lógica de creación de opciones
         está en utils.menu_logic.create_pdf_menu_options()
     """
-    print("Selecciona un PDF para procesar:")
-    
-    menu_options = create_pdf_menu_options(pdf_files)
-    for option in menu_options:
-        print(option.text)
-    
-    print("-" * 50)
+    # El menú entero sale en un único write (un syscall por render en
+    # lugar de uno por línea); el flush garantiza que esté visible antes
+    # del input() bloqueante que sigue
+    sys.stdout.write(_render_menu(tuple(pdf_files)))
+    sys.stdout.flush()
 
 
 def get_user_pdf_selection(total_options: int) -> int:
@@ -86,20 +195,11 @@ def get_user_pdf_selection(total_options: int) -> int:
         Maneja la validación de entrada pero usa utils.menu_logic
         para la lógica de validación.
     """
-    from utils.menu_logic import validate_menu_selection
-    
-    while True:
-        try:
-            choice = int(input(f"Ingresa tu opción (1-{total_options}): "))
-            if validate_menu_selection(choice, total_options):
-                return choice
-            else:
-                print(f"Opción inválida. Ingresa un número entre 1 y {total_options}.")
-        except ValueError:
-            print("Por favor ingresa un número válido.")
-        except KeyboardInterrupt:
-            print("\nSaliendo de la aplicación.")
-            raise
+    try:
+        return _read_choice(f"Ingresa tu opción (1-{total_options}): ", 1, total_options)
+    except KeyboardInterrupt:
+        print("\nSaliendo de la aplicación.")
+        raise
 
 
 def display_ocr_engine_menu() -> None:
@@ -108,10 +208,13 @@ def display_ocr_engine_menu() -> None:
     
     Función pura de presentación.
     """
-    print("\nSelecciona el motor de OCR:")
-    print("1. Tesseract básico (rápido)")
-    print("2. Tesseract + OpenCV (alta calidad)")
-    print("3. Volver al menú principal")
+    sys.stdout.write(
+        "\nSelecciona el motor de OCR:\n"
+        "1. Tesseract básico (rápido)\n"
+        "2. Tesseract + OpenCV (alta calidad)\n"
+        "3. Volver al menú principal\n"
+    )
+    sys.stdout.flush()
 
 
 def get_user_ocr_selection() -> int:
@@ -121,15 +224,7 @@ def get_user_ocr_selection() -> int:
     Returns:
         int: Opción de motor OCR seleccionada (1, 2, o 3)
     """
-    while True:
-        try:
-            choice = int(input("Ingresa tu opción (1-3): "))
-            if validate_ocr_engine_choice(choice):
-                return choice
-            else:
-                print("Opción inválida. Ingresa 1, 2 o 3.")
-        except ValueError:
-            print("Por favor ingresa un número válido.")
+    return _read_choice("Ingresa tu opción (1-3): ", 1, 3)
 
 
 def get_advanced_preprocessing_config() -> tuple[bool, bool, bool]:
@@ -139,21 +234,21 @@ def get_advanced_preprocessing_config() -> tuple[bool, bool, bool]:
     Returns:
         tuple: (enable_deskewing, enable_denoising, enable_contrast)
     """
+    # Un solo prompt en lugar de tres preguntas s/n encadenadas: una única
+    # ida y vuelta por el terminal para los tres booleanos
     print("\nConfigurando preprocesamiento OpenCV.")
-    
-    enable_deskewing = input(
-        "¿Corregir inclinación del documento? (recomendado para escaneos) (s/n): "
-    ).lower().startswith('s')
-    
-    enable_denoising = input(
-        "¿Aplicar eliminación de ruido? (recomendado para imágenes de baja calidad) (s/n): "
-    ).lower().startswith('s')
-    
-    enable_contrast = input(
-        "¿Mejorar contraste automáticamente? (recomendado para documentos con poca iluminación) (s/n): "
-    ).lower().startswith('s')
-    
-    return enable_deskewing, enable_denoising, enable_contrast
+    print("1. Corregir inclinación (recomendado para escaneos)")
+    print("2. Eliminar ruido (recomendado para imágenes de baja calidad)")
+    print("3. Mejorar contraste (recomendado para poca iluminación)")
+
+    respuesta = input(
+        "Ingresa los números a activar separados por comas (Enter = todos): "
+    )
+    if not respuesta.strip():
+        return True, True, True
+
+    seleccion = {parte.strip() for parte in respuesta.split(',')}
+    return '1' in seleccion, '2' in seleccion, '3' in seleccion
 
 
 def ask_for_advanced_config() -> bool:
@@ -163,8 +258,7 @@ def ask_for_advanced_config() -> bool:
     Returns:
         bool: True si quiere configuración avanzada, False para valores por defecto
     """
-    response = input("¿Configurar opciones avanzadas de preprocesamiento? (s/n): ")
-    return response.lower().startswith('s')
+    return _yes("¿Configurar opciones avanzadas de preprocesamiento? (s/n): ")
 
 
 def display_ocr_config_info(config: OCRConfig) -> None:
@@ -177,10 +271,14 @@ def display_ocr_config_info(config: OCRConfig) -> None:
     if config.engine_type == "basic":
         print("Usando Tesseract básico.")
     else:
-        print("Usando Tesseract + OpenCV con preprocesamiento avanzado.")
-        print(f"   - Corrección de inclinación: {'SI' if config.enable_deskewing else 'NO'}")
-        print(f"   - Eliminación de ruido: {'SI' if config.enable_denoising else 'NO'}")
-        print(f"   - Mejora de contraste: {'SI' if config.enable_contrast_enhancement else 'NO'}")
+        # Bloque prerenderizado en un único write; _SI_NO indexado por bool
+        # evita un condicional por flag
+        sys.stdout.write(
+            "Usando Tesseract + OpenCV con preprocesamiento avanzado.\n"
+            f"   - Corrección de inclinación: {_SI_NO[config.enable_deskewing]}\n"
+            f"   - Eliminación de ruido: {_SI_NO[config.enable_denoising]}\n"
+            f"   - Mejora de contraste: {_SI_NO[config.enable_contrast_enhancement]}\n"
+        )
 
 
 def display_processing_start(filename: str) -> None:
@@ -200,15 +298,28 @@ def display_processing_success(processing_info: dict) -> None:
     Args:
         processing_info (dict): Información del procesamiento exitoso
     """
-    print(f"\n{processing_info['filename']} procesado exitosamente!")
-    print(f"Tiempo de procesamiento: {processing_info['processing_time']:.2f} segundos")
-    print(f"Archivos generados: {processing_info['files_count']}")
-    print(f"   - Texto principal: {processing_info['main_text_file']}")
-    print(f"   - Todos los archivos: {processing_info['generated_files']}")
-    
+    # Un único write para todo el bloque: una sola adquisición del lock de
+    # stdout, una codificación y un flush, en lugar de uno por print().
+    # El listado se trunca a unas pocas entradas: el repr completo de la
+    # lista metía cientos de rutas en una sola línea en documentos grandes
+    archivos = processing_info['generated_files']
+    listado = "".join(f"     - {ruta}\n" for ruta in archivos[:10])
+    if len(archivos) > 10:
+        listado += f"     ... +{len(archivos) - 10} más\n"
+
+    salida = (
+        f"\n{processing_info['filename']} procesado exitosamente!\n"
+        f"Tiempo de procesamiento: {processing_info['processing_time']:.2f} segundos\n"
+        f"Archivos generados: {processing_info['files_count']}\n"
+        f"   - Texto principal: {processing_info['main_text_file']}\n"
+        f"{listado}"
+    )
+
     # Mostrar información adicional si se usó OpenCV
     if processing_info['ocr_config'].engine_type == "opencv":
-        print("Preprocesamiento OpenCV aplicado con éxito")
+        salida += "Preprocesamiento OpenCV aplicado con éxito\n"
+
+    sys.stdout.write(salida)
 
 
 def display_processing_error(error_info: dict) -> None:
@@ -238,7 +349,7 @@ def display_exit_message() -> None:
     print("Saliendo de la aplicación.")
 
 
-def process_document_workflow(filename: str) -> None:
+def process_document_workflow(filename: str, controller=None) -> None:
     """
     Ejecuta el flujo completo de procesamiento de un documento.
     
@@ -247,7 +358,9 @@ def process_document_workflow(filename: str) -> None:
     
     Args:
         filename (str): Nombre del archivo PDF a procesar
-        
+        controller: DocumentController a reutilizar; si es None se
+            construye uno (útil para llamadas sueltas y tests)
+
     Note:
         Separación de responsabilidades:
         - Esta función: I/O y presentación
@@ -256,7 +369,17 @@ def process_document_workflow(filename: str) -> None:
     """
     # SELECCIÓN DEL MOTOR OCR
     display_ocr_engine_menu()
-    
+
+    # Prefetch en segundo plano: mientras el usuario decide, un hilo
+    # daemon calienta el import del controlador (y con él los módulos de
+    # adaptadores); el lock de imports de Python serializa con el import
+    # diferido de más abajo, que encuentra el módulo ya en sys.modules y
+    # resulta gratuito. El coste del import queda oculto tras el tiempo
+    # de reacción humano
+    threading.Thread(
+        target=lambda: __import__("application.controllers"), daemon=True
+    ).start()
+
     ocr_choice = get_user_ocr_selection()
     
     if ocr_choice == 3:  # Volver al menú principal
@@ -285,9 +408,18 @@ def process_document_workflow(filename: str) -> None:
     # PROCESAMIENTO DEL DOCUMENTO
     display_processing_start(filename)
     
-    # Crear controlador y procesar
-    controller = DocumentController(PDF_DIR, OUT_DIR)
-    success, processing_info = controller.process_document(filename, ocr_config)
+    if controller is None:
+        # Import diferido: el controlador arrastra los módulos de
+        # adaptadores (y sus cadenas de dependencias opcionales); cargarlo
+        # aquí mantiene el arranque del menú en milisegundos y el sistema
+        # de imports lo cachea, así que solo la primera ejecución paga
+        from application.controllers import DocumentController
+
+        controller = DocumentController(PDF_DIR, OUT_DIR)
+
+    success, processing_info = _with_progress(
+        lambda: controller.process_document(filename, ocr_config)
+    )
     
     # MOSTRAR RESULTADOS
     if success:
@@ -298,6 +430,80 @@ def process_document_workflow(filename: str) -> None:
     print()  # Línea en blanco para separación visual
 
 
+# Controlador por proceso worker: cada proceso del pool construye el suyo
+# en el primer documento que recibe y lo reutiliza para el resto del lote
+_batch_controller = None
+
+
+def _batch_worker_init() -> None:
+    """
+    Inicializador de los procesos worker del lote.
+
+    Marca el proceso como worker de pool para que el adaptador OpenCV
+    limite sus hilos internos a 1: el paralelismo ya lo aporta el pool a
+    nivel de documento, y N workers × M hilos de OpenCV sobresuscribirían
+    los núcleos.
+    """
+    os.environ["OCR_CLI_POOL_WORKER"] = "1"
+
+
+def _process_one_batch(args: tuple):
+    """
+    Procesa un documento dentro de un proceso worker del pool.
+
+    Función a nivel de módulo (requisito de pickle para ProcessPool) que
+    recibe ``(nombre, ocr_config)`` y retorna ``(nombre, resultado)``.
+    """
+    global _batch_controller
+    nombre, ocr_config = args
+    if _batch_controller is None:
+        from application.controllers import DocumentController
+
+        _batch_controller = DocumentController(PDF_DIR, OUT_DIR)
+    return nombre, _batch_controller.process_document(nombre, ocr_config)
+
+
+def process_all_workflow(pdf_files: List[str]) -> None:
+    """
+    Procesa todos los PDFs del directorio en paralelo.
+
+    El procesamiento es trivialmente paralelo por documento: un
+    ProcessPoolExecutor reparte los archivos entre procesos (el GIL no
+    limita porque cada worker es un intérprete propio). Se usa la mitad
+    de los núcleos porque Tesseract y OpenCV ya explotan algo de
+    paralelismo intra-página; el resultado es un speedup casi lineal en
+    lotes, acotado por el disco compartido.
+
+    Args:
+        pdf_files (List[str]): Nombres de los PDFs a procesar
+    """
+    display_ocr_engine_menu()
+    ocr_choice = get_user_ocr_selection()
+    if ocr_choice == 3:
+        return
+    # Una única configuración para todo el lote
+    ocr_config = create_ocr_config_from_user_choices(ocr_choice)
+    display_ocr_config_info(ocr_config)
+
+    # Import diferido: el módulo de pools solo se paga al usar el lote
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = max(1, (os.cpu_count() or 2) // 2)
+    print(f"\nProcesando {len(pdf_files)} documentos con {workers} procesos.")
+    trabajos = [(nombre, ocr_config) for nombre in pdf_files]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_batch_worker_init
+    ) as pool:
+        for nombre, (success, processing_info) in pool.map(
+            _process_one_batch, trabajos
+        ):
+            if success:
+                display_processing_success(processing_info)
+            else:
+                display_processing_error(processing_info)
+    print()
+
+
 def main() -> None:
     """
     Función principal que ejecuta el bucle interactivo de la aplicación.
@@ -313,6 +519,41 @@ def main() -> None:
     - utils.menu_logic: Validación de selecciones
     - DocumentController: Procesamiento de documentos
     """
+    # Controlador compartido entre iteraciones: se construye perezosamente
+    # en el primer documento (para no adelantar imports pesados al arranque)
+    # y se reutiliza después, en lugar de instanciar uno por documento
+    controller = None
+
+    # Modo automático (--auto): con un único PDF en el directorio se
+    # procesa sin pasar por los menús, eligiendo motor según el PDF tenga
+    # capa de texto (nativo -> básico) o no (escaneo -> OpenCV)
+    if "--auto" in sys.argv[1:]:
+        try:
+            pdf_files = discover_pdf_files(PDF_DIR)
+        except (FileNotFoundError, NotADirectoryError):
+            display_no_pdfs_message()
+            return
+        if len(pdf_files) == 1:
+            selected_file = pdf_files[0]
+            engine = 1 if _sniff_has_text(PDF_DIR / selected_file) else 2
+            ocr_config = create_ocr_config_from_user_choices(engine)
+            display_ocr_config_info(ocr_config)
+            display_processing_start(selected_file)
+
+            from application.controllers import DocumentController
+
+            controller = DocumentController(PDF_DIR, OUT_DIR)
+            success, processing_info = _with_progress(
+                lambda: controller.process_document(selected_file, ocr_config)
+            )
+            if success:
+                display_processing_success(processing_info)
+            else:
+                display_processing_error(processing_info)
+            return
+        # Con varios PDFs el modo automático no decide por el usuario:
+        # se continúa con el flujo interactivo normal
+
     while True:
         try:
             # DESCUBRIMIENTO DE ARCHIVOS (delegado a utilidad)
@@ -335,10 +576,16 @@ def main() -> None:
             if is_exit_selection(selection, len(pdf_files)):
                 display_exit_message()
                 return
+            elif is_process_all_selection(selection, len(pdf_files)):
+                process_all_workflow(pdf_files)
             else:
                 # Obtener archivo seleccionado (lógica delegada)
                 selected_file = get_selected_pdf(pdf_files, selection)
-                process_document_workflow(selected_file)
+                if controller is None:
+                    from application.controllers import DocumentController
+
+                    controller = DocumentController(PDF_DIR, OUT_DIR)
+                process_document_workflow(selected_file, controller)
                 
         except KeyboardInterrupt:
             print("\nSaliendo de la aplicación.")
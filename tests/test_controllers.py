@@ -108,7 +108,8 @@ class TestDocumentController(unittest.TestCase):
         mock_opencv_adapter.assert_called_once_with(
             enable_deskewing=True,
             enable_denoising=False,
-            enable_contrast_enhancement=True
+            enable_contrast_enhancement=True,
+            input_is_scan=True,
         )
     
     def test_process_document_file_not_found(self):
@@ -170,7 +171,8 @@ class TestDocumentController(unittest.TestCase):
             mock_adapter.assert_called_once_with(
                 enable_deskewing=False,
                 enable_denoising=True,
-                enable_contrast_enhancement=False
+                enable_contrast_enhancement=False,
+                input_is_scan=True,
             )
     
     def test_create_ocr_adapter_invalid_type(self):
@@ -8,7 +8,12 @@ sin necesidad de simulación de entrada/salida.
 import pytest
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from utils.file_utils import discover_pdf_files, validate_pdf_exists, get_file_info
+from utils.file_utils import (
+    discover_pdf_files,
+    validate_pdf_exists,
+    get_file_info,
+    fast_page_count,
+)
 
 
 class TestDiscoverPdfFiles:
@@ -112,3 +117,29 @@ class TestGetFileInfo:
         
         with pytest.raises(FileNotFoundError):
             get_file_info(nonexistent_file)
+
+
+class TestFastPageCount:
+    """Tests para el conteo rápido de páginas vía trailer."""
+
+    def test_fast_page_count_reads_trailer(self):
+        """Test con un trailer mínimo bien formado."""
+        with TemporaryDirectory() as tmpdir:
+            pdf = Path(tmpdir) / "doc.pdf"
+            pdf.write_bytes(
+                b"%PDF-1.4\n"
+                b"1 0 obj\n<< /Type /Pages /Kids [] /Count 7 >>\nendobj\n"
+                b"%%EOF\n"
+            )
+            assert fast_page_count(pdf) == 7
+
+    def test_fast_page_count_without_trailer(self):
+        """Test con un archivo sin nodo /Pages legible."""
+        with TemporaryDirectory() as tmpdir:
+            pdf = Path(tmpdir) / "doc.pdf"
+            pdf.write_bytes(b"%PDF-1.4\ncontenido sin trailer\n")
+            assert fast_page_count(pdf) == 0
+
+    def test_fast_page_count_nonexistent_file(self):
+        """Test con un archivo inexistente."""
+        assert fast_page_count(Path("/no/existe.pdf")) == 0
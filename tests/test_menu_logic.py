@@ -10,6 +10,7 @@ from utils.menu_logic import (
     validate_menu_selection,
     get_selected_pdf,
     is_exit_selection,
+    is_process_all_selection,
     create_ocr_config_from_user_choices,
     validate_ocr_engine_choice,
     OCRConfig
@@ -98,6 +99,19 @@ class TestIsExitSelection:
         assert is_exit_selection(2, 2) is False  # 2 es PDF cuando hay 2 PDFs
 
 
+class TestIsProcessAllSelection:
+    """Tests para detectar la selección de procesamiento en lote."""
+
+    def test_is_process_all_selection_true(self):
+        """Test cuando es "Procesar todos" (última opción del menú)."""
+        assert is_process_all_selection(4, 2) is True  # 4 con 2 PDFs
+
+    def test_is_process_all_selection_false(self):
+        """Test cuando no es "Procesar todos"."""
+        assert is_process_all_selection(3, 2) is False  # 3 es salir
+        assert is_process_all_selection(1, 2) is False  # 1 es PDF
+
+
 class TestCreateOcrConfigFromUserChoices:
     """Tests para crear configuración OCR."""
     
@@ -0,0 +1,73 @@
+"""
+Tests para la integración de tablas en el texto OCR.
+
+La lógica de coincidencia (detección de regiones, mejor match por
+Jaccard, apéndice de sobrantes) es pura y determinista: se testea con
+texto fijo y tablas como listas de listas, sin tocar pandas ni disco.
+"""
+
+import pytest
+
+from adapters.storage_filesystem import FileStorage
+
+TEXTO_CON_TABLA = (
+    "Informe de compras\n"
+    "\n"
+    "Código Descripción Cantidad\n"
+    "A1 Tornillos 100\n"
+    "B2 Tuercas 50\n"
+    "\n"
+    "Fin del informe.\n"
+)
+
+TABLA_COINCIDENTE = [
+    ["Código", "Descripción", "Cantidad"],
+    ["A1", "Tornillos", "100"],
+    ["B2", "Tuercas", "50"],
+]
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return FileStorage(tmp_path, use_uring=False)
+
+
+class TestIntegrateTablesInText:
+    """Tests para _integrate_tables_in_text_simple."""
+
+    def test_matched_region_replaced(self, storage):
+        """La región aplanada se sustituye por la tabla estructurada."""
+        resultado, usadas = storage._integrate_tables_in_text_simple(
+            TEXTO_CON_TABLA, [TABLA_COINCIDENTE]
+        )
+
+        assert usadas == {0}
+        assert "### Tabla 1" in resultado
+        # Las líneas aplanadas del OCR desaparecen del cuerpo
+        assert "A1 Tornillos 100" not in resultado
+        # El texto circundante se conserva
+        assert "Informe de compras" in resultado
+        assert "Fin del informe." in resultado
+
+    def test_no_candidate_goes_to_appendix(self, storage):
+        """Sin tabla parecida, el texto queda intacto y nada se marca usado.
+
+        Las tablas no usadas las lista save() en el apéndice.
+        """
+        tabla_ajena = [["Nombre", "Edad"], ["Ana", "30"]]
+        resultado, usadas = storage._integrate_tables_in_text_simple(
+            TEXTO_CON_TABLA, [tabla_ajena]
+        )
+
+        assert usadas == set()
+        assert resultado == TEXTO_CON_TABLA
+
+    def test_text_without_keywords_unchanged(self, storage):
+        """El pre-filtro deja pasar intacto un texto sin cabeceras de tabla."""
+        texto = "Carta ordinaria sin estructura alguna.\n"
+        resultado, usadas = storage._integrate_tables_in_text_simple(
+            texto, [TABLA_COINCIDENTE]
+        )
+
+        assert usadas == set()
+        assert resultado is texto
@@ -0,0 +1,81 @@
+"""
+Tests para la validación y corrección de texto OCR.
+"""
+
+from utils.text_validator import TextValidator
+
+
+class TestAutoCorrectOcrErrors:
+    """Tests para la corrección automática de errores de OCR."""
+
+    def setup_method(self):
+        self.validator = TextValidator()
+
+    def test_empty_text(self):
+        """Texto vacío se devuelve tal cual."""
+        assert self.validator.auto_correct_ocr_errors("") == ""
+
+    def test_single_char_glyphs(self):
+        """Las confusiones de un carácter pasan por translate."""
+        assert self.validator.auto_correct_ocr_errors("e|egir") == "elegir"
+        assert self.validator.auto_correct_ocr_errors("“cita”") == '"cita"'
+
+    def test_multi_char_glyphs(self):
+        """Las confusiones de varios caracteres usan la alternancia."""
+        assert self.validator.auto_correct_ocr_errors("vvifi") == "wifi"
+        assert self.validator.auto_correct_ocr_errors("hola , mundo .") == "hola, mundo."
+
+    def test_clean_text_unchanged(self):
+        """Texto sin errores queda idéntico."""
+        texto = "Informe anual de resultados."
+        assert self.validator.auto_correct_ocr_errors(texto) == texto
+
+
+class TestContextualNumberLetterCorrection:
+    """Tests para la corrección contextual dígito/letra."""
+
+    def setup_method(self):
+        self.validator = TextValidator()
+
+    def test_letter_context(self):
+        """Dígitos dentro de palabras se vuelven letras."""
+        assert self.validator.contextual_number_letter_correction("0CRA") == "OCRA"
+
+    def test_digit_context(self):
+        """Letras dentro de números se vuelven dígitos."""
+        assert self.validator.contextual_number_letter_correction("l23O5") == "12305"
+
+    def test_pure_tokens_unchanged(self):
+        """Tokens puros (solo letras o solo dígitos) no cambian."""
+        texto = "factura 2024 importe"
+        assert self.validator.contextual_number_letter_correction(texto) == texto
+
+
+class TestCleanupAndMetrics:
+    """Tests para limpieza de puntuación y métricas de calidad."""
+
+    def setup_method(self):
+        self.validator = TextValidator()
+
+    def test_fix_punctuation_spacing(self):
+        """Espacios normalizados alrededor de signos."""
+        assert self.validator.fix_punctuation("hola ,mundo .fin") == "hola, mundo. fin"
+
+    def test_fix_capitalization(self):
+        """Mayúscula inicial y tras fin de oración."""
+        assert self.validator.fix_capitalization("hola. mundo") == "Hola. Mundo"
+
+    def test_metrics_ranges(self):
+        """Las métricas quedan en [0, 1]."""
+        assert self.validator.calculate_word_ratio("") == 0.0
+        assert 0.0 < self.validator.calculate_word_ratio("uno 2 tres") <= 1.0
+        assert self.validator.calculate_special_chars_ratio("abc~") == 0.25
+
+    def test_validate_extracted_data(self):
+        """Los datos estructurados caen en su categoría."""
+        datos = self.validator.validate_extracted_data(
+            "Escribir a ana@ejemplo.com antes del 12/05/2024."
+        )
+        assert datos["emails"] == ["ana@ejemplo.com"]
+        assert datos["dates"] == ["12/05/2024"]
+        assert datos["urls"] == []
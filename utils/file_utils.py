@@ -5,9 +5,19 @@ Este módulo contiene funciones puras para operaciones de archivos
 que pueden ser fácilmente testeadas sin depender de I/O específico.
 """
 
+import os
+import re
+import stat as stat_module
+import sys
+from bisect import insort
 from pathlib import Path
 from typing import List
 
+# Listados recientes por directorio: (mtime_ns del directorio, nombres).
+# El mtime de un directorio cambia con cualquier alta/baja/renombre de
+# entradas, así que es un invalidador exacto para este caso de uso.
+_scan_cache: "dict[str, tuple]" = {}
+
 
 def discover_pdf_files(directory: Path) -> List[str]:
     """
@@ -29,19 +39,60 @@ def discover_pdf_files(directory: Path) -> List[str]:
         >>> print(archivos)
         ['documento1.pdf', 'reporte.pdf']
     """
-    if not directory.exists():
+    # Un único stat cubre las tres necesidades: existencia, tipo y mtime
+    # para la caché (antes exists() + is_dir() + stat() costaban tres
+    # syscalls por render del menú)
+    dir_key = os.fspath(directory)
+    try:
+        st = os.stat(directory)
+    except FileNotFoundError:
         raise FileNotFoundError(f"El directorio {directory} no existe")
-    
-    if not directory.is_dir():
+
+    if not stat_module.S_ISDIR(st.st_mode):
         raise NotADirectoryError(f"{directory} no es un directorio")
-    
+
+    # Caché invalidada por el mtime del directorio: en un bucle interactivo
+    # se relee /pdfs tras cada documento aunque nada haya cambiado; el
+    # mtime cambia al crear/borrar/renombrar entradas, así que es un
+    # invalidador exacto que sustituye al rescan completo
+    mtime = st.st_mtime_ns
+    cached = _scan_cache.get(dir_key)
+    if cached is not None and cached[0] == mtime:
+        return list(cached[1])
+
     try:
-        # Buscar archivos PDF de forma case-insensitive y ordenar sin sensibilidad a mayúsculas
-        pdf_files = [
-            p.name for p in directory.iterdir()
-            if p.is_file() and p.suffix.lower() == ".pdf"
-        ]
-        return sorted(pdf_files, key=lambda s: s.lower())
+        # os.scandir entrega el tipo de archivo cacheado desde el propio
+        # readdir: ni un stat por entrada ni un objeto Path por archivo,
+        # a diferencia de iterdir()/glob(). Filtro case-insensitive y orden
+        # sin sensibilidad a mayúsculas, como antes.
+        with os.scandir(directory) as it:
+            # sys.intern deduplica: los mismos nombres reaparecen en cada
+            # render del menú, en las claves de caché y en los mensajes;
+            # internarlos hace que todas esas referencias compartan una
+            # única asignación y acelera los hash de las tuplas clave
+            pdf_files = [
+                sys.intern(entry.name)
+                for entry in it
+                if not entry.name.startswith(".")
+                and entry.name.lower().endswith(".pdf")
+                and entry.is_file(follow_symlinks=False)
+            ]
+        if cached is not None:
+            # Mantenimiento incremental del orden: partiendo del listado
+            # ordenado anterior, las bajas se filtran en O(N) y cada alta
+            # se inserta con bisect en O(log N), en lugar de reordenar
+            # todo en O(N log N) por cada cambio del directorio
+            actuales = set(pdf_files)
+            previos = set(cached[1])
+            ordenados = [nombre for nombre in cached[1] if nombre in actuales]
+            for nombre in pdf_files:
+                if nombre not in previos:
+                    insort(ordenados, nombre, key=str.lower)
+            pdf_files = ordenados
+        else:
+            pdf_files.sort(key=str.lower)
+        _scan_cache[dir_key] = (mtime, tuple(pdf_files))
+        return pdf_files
     except PermissionError as e:
         raise PermissionError(f"Sin permisos para leer {directory}: {e}")
 
@@ -61,8 +112,12 @@ def validate_pdf_exists(directory: Path, filename: str) -> bool:
         >>> validate_pdf_exists(Path("/pdfs"), "documento.pdf")
         True
     """
-    file_path = directory / filename
-    return file_path.exists() and file_path.is_file() and file_path.suffix.lower() == '.pdf'
+    # La comprobación de sufijo (puro trabajo de cadena) va primero y el
+    # isfile único sustituye al par exists() + is_file(), que costaba dos
+    # stats por validación
+    if not filename.lower().endswith('.pdf'):
+        return False
+    return os.path.isfile(os.path.join(os.fspath(directory), filename))
 
 
 def get_file_info(file_path: Path) -> dict:
@@ -89,3 +144,37 @@ def get_file_info(file_path: Path) -> dict:
         "modified": stat.st_mtime,
         "is_readable": file_path.is_file()
     }
+
+
+def fast_page_count(pdf_path: Path) -> int:
+    """
+    Estima el número de páginas de un PDF leyendo solo su cola.
+
+    El trailer de un PDF bien formado contiene el nodo raíz del árbol de
+    páginas (``/Type /Pages ... /Count N``); escanear los últimos KB del
+    archivo con una expresión regular evita parsear la tabla xref completa,
+    que es lo que hace cualquier lector de PDF solo para un ``len(pages)``.
+
+    Args:
+        pdf_path (Path): Ruta al archivo PDF
+
+    Returns:
+        int: Número de páginas declarado en el trailer, o 0 si no se pudo
+             determinar (archivo ilegible, trailer comprimido, etc.)
+    """
+    try:
+        with open(pdf_path, "rb") as handle:
+            handle.seek(0, 2)
+            size = handle.tell()
+            handle.seek(max(0, size - 8192))
+            tail = handle.read()
+        # En árboles de páginas divididos los nodos intermedios también
+        # declaran /Count (el de su subárbol): el nodo raíz es siempre el
+        # de mayor cuenta, así que el máximo es la estimación correcta
+        # aunque un nodo no-raíz aparezca el último en la cola del archivo
+        matches = re.findall(rb"/Type\s*/Pages\b[^>]*?/Count\s+(\d+)", tail)
+        if matches:
+            return max(int(m) for m in matches)
+    except OSError:
+        pass
+    return 0
@@ -24,6 +24,11 @@ class OCRConfig:
     enable_deskewing: bool = False
     enable_denoising: bool = False
     enable_contrast_enhancement: bool = False
+    # El motor OpenCV solo aplica denoising sobre escaneos reales; True
+    # por defecto porque quien elige ese motor casi siempre procesa un
+    # escaneo, y así activar enable_denoising conserva su efecto. Los
+    # llamadores que sepan que el PDF es nativo pueden ponerlo en False
+    input_is_scan: bool = True
 
 
 def create_pdf_menu_options(pdf_files: List[str]) -> List[MenuOption]:
@@ -42,20 +47,21 @@ def create_pdf_menu_options(pdf_files: List[str]) -> List[MenuOption]:
         >>> print(options[0].text)
         "1. doc1.pdf"
     """
-    options: List[MenuOption] = []
-    for i, filename in enumerate(pdf_files, 1):
-        options.append(MenuOption(id=i, text=f"{i}. {filename}", value=filename))
-    
+    options: List[MenuOption] = [
+        MenuOption(id=i, text=f"{i}. {filename}", value=filename)
+        for i, filename in enumerate(pdf_files, 1)
+    ]
+
     # Agregar opción de salida siempre al final
     exit_id = len(pdf_files) + 1
     options.append(MenuOption(id=exit_id, text=f"{exit_id}. Salir", value="exit"))
-    
+
     return options
 
 
 def total_menu_options_count(pdf_files: List[str]) -> int:
-    """Cantidad total de opciones incluyendo "Salir"."""
-    return len(pdf_files) + 1
+    """Cantidad total de opciones incluyendo "Salir" y "Procesar todos"."""
+    return len(pdf_files) + 2
 
 
 def validate_menu_selection(selection: int, total_options: int) -> bool:
@@ -130,6 +136,23 @@ def is_exit_selection(selection: int, total_pdf_files: int) -> bool:
     return selection == total_pdf_files + 1
 
 
+def is_process_all_selection(selection: int, total_pdf_files: int) -> bool:
+    """
+    Determina si la selección corresponde a "Procesar todos".
+
+    La opción ocupa el último número del menú (tras "Salir", que conserva
+    su posición histórica N+1).
+
+    Args:
+        selection (int): Número seleccionado
+        total_pdf_files (int): Total de archivos PDF disponibles
+
+    Returns:
+        bool: True si es la opción de procesamiento en lote
+    """
+    return selection == total_pdf_files + 2
+
+
 def create_ocr_config_from_user_choices(
     engine_choice: int,
     enable_deskewing: bool = True,